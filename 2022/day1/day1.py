@@ -1,34 +1,62 @@
 """Advent of code 2022 Day 1."""
 
-from advent_of_code.util import inputs
+from collections.abc import Iterable, Iterator
 
+from advent_of_code.util import inputs, streams
 
-def _calculate_calories(lines: list[str]) -> list[int]:
+TOP_ELVES = 3
+
+
+def _calculate_calories(lines: Iterable[str]) -> Iterator[int]:
     """Calculates the calories for each elf.
 
     The amount of calories carried by a single elf is separted by an empty line.
 
     Args:
-        lines (list[str]): the line
+        lines (Iterable[str]): the lines
+
+    Returns:
+        Iterator[int]: the calories for each elf, including the last even without a trailing empty line
+    """
+    return streams.fold_groups(lines, lambda calories, line: calories + int(line), 0)
+
+
+def parse(lines: list[str]) -> list[int]:
+    """Parses the input into the calories of the elves carrying the most, most first.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        list[int]: the calories carried by the top three elves, sorted most to least
+    """
+    return streams.top_k(_calculate_calories(lines), TOP_ELVES)
+
+
+def part_one(calories: list[int]) -> int:
+    """Gets the calories carried by the elf carrying the most."""
+    return calories[0]
+
+
+def part_two(calories: list[int]) -> int:
+    """Gets the calories carried by the three elves carrying the most."""
+    return sum(calories[:TOP_ELVES])
+
+
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines, keeping only the top three elves in memory.
+
+    Args:
+        lines (Iterable[str]): the input lines
 
     Returns:
-        list[int]: list of calculated calories
+        tuple[int, int]: the answers to part one and part two
     """
-    current = 0
-    calories = []
-    for line in lines:
-        if not line:
-            calories.append(current)
-            current = 0
-            continue
-        current += int(line)
-    return calories
+    calories = parse(lines)
+    return part_one(calories), part_two(calories)
 
 
 if __name__ == "__main__":
-    lines = inputs.get_input()
-    calories = sorted(_calculate_calories(lines), reverse=True)
-    # part one
-    print(calories[0])
-    # part two
-    print(sum([calories[0], calories[1], calories[2]]))
+    calories = parse(inputs.get_input(__file__))
+    print(part_one(calories))
+    print(part_two(calories))
@@ -0,0 +1,25 @@
+"""Input generator for Advent of Code 2022 Day 1."""
+
+import random
+from collections.abc import Iterator
+
+BASE_ELVES = 250
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Each elf carries between 1 and 15 snacks; elves are separated by a blank line.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    for elf in range(BASE_ELVES * scale):
+        if elf:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
@@ -1,5 +1,7 @@
 """Advent of code 2022 Day 2."""
 
+from collections import Counter
+from collections.abc import Iterable
 from enum import IntEnum
 
 from advent_of_code.util import inputs
@@ -21,137 +23,87 @@ class Shapes(IntEnum):
     SCISSORS = 3
 
 
-def _calculate_score_part_one(line: str) -> int:
-    """Calculates the score in accordance with part one.
+OPPONENT_SHAPES = "ABC"
+SECOND_COLUMN = "XYZ"
+# the result of playing a shape against the opponent's, indexed by how many shapes along from theirs ours is
+_RESULTS_BY_OFFSET = (Results.DRAW, Results.WIN, Results.LOSE)
+# the result the second column asks for in part two
+_RESULTS_BY_COLUMN = (Results.LOSE, Results.DRAW, Results.WIN)
+
+
+def _score_tables() -> tuple[dict[str, int], dict[str, int]]:
+    """Scores each of the nine possible rounds under the rules of both parts.
+
+    Shapes are in the order rock, paper, scissors in both columns, and each shape beats the one before it.
+
+    Returns:
+        tuple[dict[str, int], dict[str, int]]: the score of each possible line for part one and part two
+    """
+    shapes = list(Shapes)
+    part_one, part_two = {}, {}
+    for opp, opp_code in enumerate(OPPONENT_SHAPES):
+        for column, code in enumerate(SECOND_COLUMN):
+            line = f"{opp_code} {code}"
+            # the second column is the shape to play
+            part_one[line] = shapes[column] + _RESULTS_BY_OFFSET[(column - opp) % len(shapes)]
+            # the second column is the result to get, so play the shape that gets it
+            result = _RESULTS_BY_COLUMN[column]
+            part_two[line] = shapes[(opp + _RESULTS_BY_OFFSET.index(result)) % len(shapes)] + result
+    return part_one, part_two
+
+
+_SCORES_PART_ONE, _SCORES_PART_TWO = _score_tables()
+
+
+def _total_score(rounds: Counter[str], scores: dict[str, int]) -> int:
+    """Totals the score of every round from how many times each possible round was played.
 
     Args:
-        line (str): the line to calculate the score for
+        rounds (Counter[str]): the number of times each line appears in the input
+        scores (dict[str, int]): the score of each possible line
 
     Returns:
-        int: the score for this line
+        int: the total score
     """
-    opp, shape = line.split(" ")
-
-    score = 0
-    match shape:
-        case "X":
-            score += Shapes.ROCK
-        case "Y":
-            score += Shapes.PAPER
-        case "Z":
-            score += Shapes.SCISSORS
-
-    match opp:
-        case "A":
-            # opponent played rock
-            match shape:
-                case "X":
-                    # draw
-                    score += Results.DRAW
-                case "Y":
-                    # lose
-                    score += Results.WIN
-                case "Z":
-                    # lose
-                    score += Results.LOSE
-        case "B":
-            # opponent played paper
-            match shape:
-                case "X":
-                    # lose
-                    score += Results.LOSE
-                case "Y":
-                    # draw
-                    score += Results.DRAW
-                case "Z":
-                    # win
-                    score += Results.WIN
-        case "C":
-            # opponent played scissors
-            match shape:
-                case "X":
-                    # lose
-                    score += Results.WIN
-                case "Y":
-                    # draw
-                    score += Results.LOSE
-                case "Z":
-                    # win
-                    score += Results.DRAW
-    return score
-
-
-def _calculate_score_part_two(line: str) -> int:
-    """Calculates the score in accordance with part two.
+    return sum(count * scores[line] for line, count in rounds.items())
+
+
+def parse(lines: Iterable[str]) -> Counter[str]:
+    """Parses the input into how many times each of the nine possible rounds was played.
 
     Args:
-        line (str): the line to calculate the score for
+        lines (Iterable[str]): the input lines
 
     Returns:
-        int: the score for this line
+        Counter[str]: the number of times each line appears
     """
-    opp, shape = line.split(" ")
-
-    score = 0
-
-    match opp:
-        case "A":
-            # opponent played rock
-            match shape:
-                case "X":
-                    # lose
-                    score += Results.LOSE
-                    score += Shapes.SCISSORS
-                case "Y":
-                    # draw
-                    score += Results.DRAW
-                    score += Shapes.ROCK
-                case "Z":
-                    # win
-                    score += Results.WIN
-                    score += Shapes.PAPER
-        case "B":
-            # opponent played paper
-            match shape:
-                case "X":
-                    # lose
-                    score += Results.LOSE
-                    score += Shapes.ROCK
-                case "Y":
-                    # draw
-                    score += Results.DRAW
-                    score += Shapes.PAPER
-                case "Z":
-                    # win
-                    score += Results.WIN
-                    score += Shapes.SCISSORS
-        case "C":
-            # opponent played scissors
-            match shape:
-                case "X":
-                    # lose
-                    score += Results.LOSE
-                    score += Shapes.PAPER
-                case "Y":
-                    # draw
-                    score += Results.DRAW
-                    score += Shapes.SCISSORS
-                case "Z":
-                    # win
-                    score += Results.WIN
-                    score += Shapes.ROCK
-    return score
+    return Counter(lines)
 
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+def part_one(rounds: Counter[str]) -> int:
+    """Gets the total score when the second column is the shape to play."""
+    return _total_score(rounds, _SCORES_PART_ONE)
+
+
+def part_two(rounds: Counter[str]) -> int:
+    """Gets the total score when the second column is the result to get."""
+    return _total_score(rounds, _SCORES_PART_TWO)
 
-    total_score_part_one, total_score_part_two = 0, 0
-    for line in lines:
-        part_one = _calculate_score_part_one(line)
-        part_two = _calculate_score_part_two(line)
-        total_score_part_one += part_one
-        total_score_part_two += part_two
 
-    print(total_score_part_one)
-    print(total_score_part_two)
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines, keeping only the count of each possible round.
+
+    Args:
+        lines (Iterable[str]): the input lines
+
+    Returns:
+        tuple[int, int]: the answers to part one and part two
+    """
+    rounds = parse(lines)
+    return part_one(rounds), part_two(rounds)
+
+
+if __name__ == "__main__":
+    rounds = parse(inputs.get_input(__file__))
+    print(part_one(rounds))
+    print(part_two(rounds))
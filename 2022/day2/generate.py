@@ -0,0 +1,20 @@
+"""Input generator for Advent of Code 2022 Day 2."""
+
+import random
+from collections.abc import Iterator
+
+BASE_ROUNDS = 2500
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    for _ in range(BASE_ROUNDS * scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
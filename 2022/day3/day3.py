@@ -1,64 +1,99 @@
 """Advent of Code 2022 Day 3."""
 
+from collections.abc import Iterable
 from itertools import batched
 from string import ascii_letters
 
+import numpy as np
 from advent_of_code.util import inputs
 
+GROUP_SIZE = 3
+# lines are converted in chunks of whole groups so the per-byte temporaries stay small
+CHUNK_SIZE = GROUP_SIZE * 2**14
+# each item as a bit in a 52-bit mask, indexed by byte, placed so that the bit length of a single item's mask
+# is its priority
+_ITEM_BITS = np.zeros(256, dtype=np.uint64)
+_ITEM_BITS[list(ascii_letters.encode())] = np.left_shift(1, np.arange(len(ascii_letters), dtype=np.uint64))
 
-def _split_backpack(line: str) -> tuple[str, str]:
-    """Splits a line into two - representing the two backpack comparments."""
-    mid = int(len(line) / 2)
-    return line[0:mid], line[mid:]
 
+def _priorities(masks: np.ndarray) -> np.ndarray:
+    """Gets the priority of the single item in each mask.
 
-def _calculate_priority(first: str, second: str) -> int:
-    """Calculates the shared item priority of two backpack compartments.
+    The same as `int.bit_length` for every mask at once: the mask is a power of two, which floating point
+    represents exactly, so its exponent is its bit length.
 
     Args:
-        first (str): the first compartment string
-        second (str): the second compartment string
+        masks (np.ndarray): the masks, each with a single bit set
 
     Returns:
-        int: the score of the shared item
+        np.ndarray: the priority of each mask's item
     """
-    for item in first:
-        if item not in second:
-            continue
-        break
-    return ascii_letters.index(item) + 1
+    return np.frexp(masks.astype(np.float64))[1].astype(np.int64)
 
 
-def _calculate_group_priority(first: str, second: str, third: str) -> int:
-    """Calculates the shared item priority of three backpacks.
+def _compartment_masks(lines: list[str]) -> np.ndarray:
+    """Converts some backpacks into the items in each of their compartments.
+
+    The lines are converted to bits with one table lookup and each compartment is reduced to a mask with a
+    single `np.bitwise_or.reduceat`.
+
+    Args:
+        lines (list[str]): the backpacks
+
+    Returns:
+        np.ndarray: (n, 2) uint64 array of the mask of the items in each backpack's two compartments
+    """
+    lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    starts = np.cumsum(lengths) - lengths
+    boundaries = np.column_stack((starts, starts + lengths // 2)).ravel()
+    bits = _ITEM_BITS[np.frombuffer("".join(lines).encode(), dtype=np.uint8)]
+    return np.bitwise_or.reduceat(bits, boundaries).reshape(-1, 2)
+
+
+def parse(lines: list[str]) -> np.ndarray:
+    """Parses the input into the items in each compartment of each backpack.
+
+    Works a chunk of lines at a time, so only the masks themselves grow with the input.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        np.ndarray: (n, 2) uint64 array of the mask of the items in each backpack's two compartments
+    """
+    chunks = range(0, len(lines), CHUNK_SIZE)
+    return np.concatenate([_compartment_masks(lines[start : start + CHUNK_SIZE]) for start in chunks])
+
+
+def part_one(compartments: np.ndarray) -> int:
+    """Gets the sum of the priorities of the item in both compartments of each backpack."""
+    return int(_priorities(compartments[:, 0] & compartments[:, 1]).sum())
+
+
+def part_two(compartments: np.ndarray) -> int:
+    """Gets the sum of the priorities of the badge in each group of three backpacks."""
+    backpacks = (compartments[:, 0] | compartments[:, 1]).reshape(-1, GROUP_SIZE)
+    return int(_priorities(np.bitwise_and.reduce(backpacks, axis=1)).sum())
+
+
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines, a chunk of whole groups at a time.
 
     Args:
-        first (str): the first backpack string
-        second (str): the second backpack string
-        third (str): the third backpack string
+        lines (Iterable[str]): the input lines
 
     Returns:
-        int: the score of the shared item
+        tuple[int, int]: the answers to part one and part two
     """
-    for item in first:
-        if item in second and item in third:
-            break
-    return ascii_letters.index(item) + 1
+    part_one_total, part_two_total = 0, 0
+    for chunk in batched(lines, CHUNK_SIZE):
+        compartments = _compartment_masks(list(chunk))
+        part_one_total += part_one(compartments)
+        part_two_total += part_two(compartments)
+    return part_one_total, part_two_total
 
 
 if __name__ == "__main__":
-    lines = inputs.get_input()
-
-    # part one
-    part_one_total = 0
-    for line in lines:
-        score = _calculate_priority(*_split_backpack(line))
-        part_one_total += score
-    print(part_one_total)
-
-    # part two
-    part_two_total = 0
-    for group in batched(lines, 3):
-        score = _calculate_group_priority(*group)
-        part_two_total += score
-    print(part_two_total)
+    backpacks = parse(inputs.get_input(__file__))
+    print(part_one(backpacks))
+    print(part_two(backpacks))
@@ -0,0 +1,54 @@
+"""Input generator for Advent of Code 2022 Day 3."""
+
+import random
+from collections.abc import Iterator
+from string import ascii_letters
+
+BASE_GROUPS = 100
+POOL_SIZE = 17
+
+
+def _rucksack(badge: str, pool: list[str], rng: random.Random) -> str:
+    """Generates a single rucksack.
+
+    The first half of the pool only goes in the first compartment and the second half only in the second
+    compartment, apart from one shared item that goes in both. The badge only goes in the first compartment.
+
+    Args:
+        badge (str): the group's badge
+        pool (list[str]): the items only this rucksack in the group may contain
+        rng (random.Random): the seeded random generator to use
+
+    Returns:
+        str: the rucksack
+    """
+    shared, *rest = pool
+    mid = len(rest) // 2
+    first_items, second_items = rest[:mid], rest[mid:]
+    size = rng.randint(8, 24)
+    first = [shared, badge, *rng.choices(first_items, k=size - 2)]
+    second = [shared, *rng.choices(second_items, k=size - 1)]
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Rucksacks come in groups of three that share exactly one badge, and each rucksack has exactly one item
+    in both compartments.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    letters = list(ascii_letters)
+    for _ in range(BASE_GROUPS * scale):
+        rng.shuffle(letters)
+        badge, *others = letters
+        for idx in range(3):
+            yield _rucksack(badge, others[idx * POOL_SIZE : (idx + 1) * POOL_SIZE], rng)
@@ -1,75 +1,136 @@
 """Advent of Code 2022 Day 4."""
 
+from collections.abc import Iterable
+
+import numpy as np
 from advent_of_code.util import inputs
 
 
-def _rangify_section(section: str) -> list[int]:
-    """Turn a 'section' into a list of integers.
+def _intervalise_section(section: str) -> tuple[int, int]:
+    """Turn a 'section' into an inclusive (start, end) interval.
 
     Args:
         section (str): two numbers separted by a '-' as a string
 
     Returns:
-        list[int]: the range of integers for the section
+        tuple[int, int]: the start and end of the section
     """
     start, end = section.split("-")
-    return list(range(int(start), int(end) + 1))
+    return int(start), int(end)
 
 
-def _rangify_line(line: str) -> list[list[int], list[int]]:
-    """Turns a line with two sections into two list of integers.
+def _intervalise_line(line: str) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Turns a line with two sections into two intervals.
 
     Args:
         line (str): the line to process
 
     Returns:
-        list[list[int], list[int]]: a list of two lists containing integers
+        tuple[tuple[int, int], tuple[int, int]]: the intervals of the two sections
     """
     first, second = line.split(",")
-    return [_rangify_section(first), _rangify_section(second)]
+    return _intervalise_section(first), _intervalise_section(second)
 
 
-def _check_total_containment(shorter: list[int], longer: list[int]) -> bool:
-    """Checks if the entirety of the shorter list is contained within the longer list.
+def _check_total_containment(first: tuple[int, int], second: tuple[int, int]) -> bool:
+    """Checks if either interval is entirely contained within the other.
 
     Args:
-        shorter (list[int]): a smaller list of integers
-        longer (list[int]): a longer list of integers
+        first (tuple[int, int]): the first interval
+        second (tuple[int, int]): the second interval
 
     Returns:
-        bool: whether the shorter is container within the longer
+        bool: whether one interval contains the other
     """
-    return all(x in longer for x in shorter)
+    (first_start, first_end), (second_start, second_end) = first, second
+    return (first_start <= second_start and second_end <= first_end) or (
+        second_start <= first_start and first_end <= second_end
+    )
 
 
-def _check_any_containment(shorter: list[int], longer: list[int]) -> bool:
-    """Checks if any items of the shorter list are also within the longer list.
+def _check_any_containment(first: tuple[int, int], second: tuple[int, int]) -> bool:
+    """Checks if the intervals overlap at all.
 
     Args:
-        shorter (list[int]): a smaller list of integers
-        longer (list[int]): a longer list of integers
+        first (tuple[int, int]): the first interval
+        second (tuple[int, int]): the second interval
 
     Returns:
-        bool: whether any of the items in shorter are container in longer
+        bool: whether the intervals share at least one section
     """
-    return any(x in longer for x in shorter)
+    (first_start, first_end), (second_start, second_end) = first, second
+    return first_start <= second_end and second_start <= first_end
 
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+def _count_total_containment(columns: np.ndarray) -> int:
+    """Counts the pairs where one interval contains the other, for every pair at once.
+
+    Args:
+        columns (np.ndarray): (n, 4) array of the first start, first end, second start and second end
+
+    Returns:
+        int: the number of pairs where one interval contains the other
+    """
+    first_start, first_end, second_start, second_end = columns.T
+    first_contains = (first_start <= second_start) & (second_end <= first_end)
+    second_contains = (second_start <= first_start) & (first_end <= second_end)
+    return int(np.count_nonzero(first_contains | second_contains))
+
+
+def _count_any_containment(columns: np.ndarray) -> int:
+    """Counts the pairs where the intervals overlap, for every pair at once.
+
+    Args:
+        columns (np.ndarray): (n, 4) array of the first start, first end, second start and second end
+
+    Returns:
+        int: the number of pairs that overlap
+    """
+    first_start, first_end, second_start, second_end = columns.T
+    return int(np.count_nonzero((first_start <= second_end) & (second_start <= first_end)))
+
+
+def parse(lines: list[str]) -> np.ndarray:
+    """Parses the input into four integer columns: the start and end of the first and second sections.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        np.ndarray: (n, 4) array with a row for each pair
+    """
+    text = " ".join(lines).replace("-", " ").replace(",", " ")
+    return np.array(text.split(), dtype=np.int64).reshape(len(lines), 4)
+
+
+def part_one(columns: np.ndarray) -> int:
+    """Gets the number of pairs where one section fully contains the other."""
+    return _count_total_containment(columns)
+
+
+def part_two(columns: np.ndarray) -> int:
+    """Gets the number of pairs where the sections overlap at all."""
+    return _count_any_containment(columns)
 
-    # part one
-    total = 0
-    for line in lines:
-        ranges = _rangify_line(line)
-        if _check_total_containment(*sorted(ranges, key=len)):
-            total += 1
-    print(total)
 
-    # part two
-    total = 0
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines.
+
+    Args:
+        lines (Iterable[str]): the input lines
+
+    Returns:
+        tuple[int, int]: the answers to part one and part two
+    """
+    total_containment, any_containment = 0, 0
     for line in lines:
-        ranges = _rangify_line(line)
-        if _check_any_containment(*sorted(ranges, key=len)):
-            total += 1
-    print(total)
+        pair = _intervalise_line(line)
+        total_containment += _check_total_containment(*pair)
+        any_containment += _check_any_containment(*pair)
+    return total_containment, any_containment
+
+
+if __name__ == "__main__":
+    columns = parse(inputs.get_input(__file__))
+    print(part_one(columns))
+    print(part_two(columns))
@@ -0,0 +1,30 @@
+"""Input generator for Advent of Code 2022 Day 4."""
+
+import random
+from collections.abc import Iterator
+
+BASE_PAIRS = 1000
+BASE_MAX_SECTION = 99
+
+
+def _section(max_section: int, rng: random.Random) -> str:
+    """Generates a single 'start-end' section."""
+    start, end = sorted((rng.randint(1, max_section), rng.randint(1, max_section)))
+    return f"{start}-{end}"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Both the number of pairs and the width of the section IDs grow with the scale.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    max_section = BASE_MAX_SECTION * scale
+    for _ in range(BASE_PAIRS * scale):
+        yield f"{_section(max_section, rng)},{_section(max_section, rng)}"
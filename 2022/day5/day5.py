@@ -1,93 +1,126 @@
-import copy
+"""Advent of Code 2022 Day 5."""
 
-from advent_of_code.util import inputs
+import numpy as np
+from advent_of_code.util import cache, inputs
 
+# the crate letters are every 4th character, starting from the second
+CRATE_WIDTH = 4
+_MOVE_WORDS = ("move", "from", "to")
 
-def _get_crates_from_row(line: str, crates: dict[int, list[str]]) -> None:
-    """Extracts the crates from a row.
+
+def _get_stacks(rows: list[str], count: int) -> tuple[str, ...]:
+    """Reads the stacks of crates a column at a time.
 
     Args:
-        line (str): the line to process
-        crates (dict[int, list[str]]): the crates representation to fill
+        rows (list[str]): the rows of crates, top first
+        count (int): the number of stacks
+
+    Returns:
+        tuple[str, ...]: each stack's crates, bottom first
     """
-    length = len(line)
-    x = 0
-    column = 1
-    while x < length:
-        crate = line[x : x + 3].strip(" ").strip("[").strip("]")
-        if column not in crates:
-            crates[column] = []
-        if crate:
-            crates[column].insert(0, crate)
-        x += 4
-        column += 1
-
-
-def _process_single_move(move: str, crates: dict[int, list[str]]) -> None:
-    """Moves the crates one at a time.
+    letters = [row.ljust(count * CRATE_WIDTH)[1::CRATE_WIDTH] for row in reversed(rows)]
+    # stacks only have gaps at the top, so the padding is all at the end of each column
+    return tuple("".join(column).rstrip() for column in zip(*letters, strict=True))
 
-    As per part one.
+
+def _get_moves(lines: list[str]) -> np.ndarray:
+    """Reads all the moves at once.
 
     Args:
-        move (str): the move string
-        crates (dict[int, list[str]]): the crates representation
+        lines (list[str]): the move lines
+
+    Returns:
+        np.ndarray: (n, 3) array of each move's count and its source and destination stack indices
     """
-    count, source, destination = (int(part) for part in move.split(" ") if part.isnumeric())
+    text = " ".join(lines)
+    for word in _MOVE_WORDS:
+        text = text.replace(word, "")
+    moves = np.array(text.split(), dtype=np.int64).reshape(len(lines), 3)
+    # stacks are numbered from 1
+    moves[:, 1:] -= 1
+    return moves
+
 
-    for _ in range(count):
-        val = crates[source].pop(-1)
-        crates[destination].append(val)
+def _process_single_move(count: int, source: list[str], destination: list[str]) -> None:
+    """Moves the crates one at a time.
+
+    As per part one. Moving them one at a time reverses their order, which is done with a single slice.
+
+    Args:
+        count (int): the number of crates to move
+        source (list[str]): the stack to move them from
+        destination (list[str]): the stack to move them to
+    """
+    start = len(source) - count
+    destination.extend(reversed(source[start:]))
+    del source[start:]
 
 
-def _process_multi_move(move: str, crates: dict[int, list[str]]) -> None:
+def _process_multi_move(count: int, source: list[str], destination: list[str]) -> None:
     """Moves the crates a few at a time.
 
-    As per part two.
+    As per part two. The crates keep their order, so they're moved with a single slice.
 
     Args:
-        move (str): the move string
-        crates (dict[int, list[str]]): the crates representation
+        count (int): the number of crates to move
+        source (list[str]): the stack to move them from
+        destination (list[str]): the stack to move them to
     """
-    count, source, destination = (int(part) for part in move.split(" ") if part.isnumeric())
-    vals = []
-    for _ in range(count):
-        val = crates[source].pop(-1)
-        vals.insert(0, val)
+    start = len(source) - count
+    destination.extend(source[start:])
+    del source[start:]
 
-    crates[destination].extend(vals)
 
+@cache.cached_parse
+def parse(lines: list[str]) -> tuple[tuple[str, ...], np.ndarray]:
+    """Parses the input into the starting crates and the moves.
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+    Args:
+        lines (list[str]): the input lines
 
-    crates: dict[int, list[str]] = {}
-    for line in lines:
-        if "[" not in line:
-            # end of crates
-            break
-        _get_crates_from_row(line, crates)
+    Returns:
+        tuple[tuple[str, ...], np.ndarray]: each stack's crates, bottom first, and the moves
+    """
+    blank = lines.index("")
+    first_move_index = blank + 1
+    # the line before the blank line numbers the stacks
+    *rows, numbers = lines[:blank]
+    return _get_stacks(rows, len(numbers.split())), _get_moves(lines[first_move_index:])
 
-    first_move_index = lines.index(next(line for line in lines if "move " in line))
 
-    moves = lines[first_move_index:]
+def part_one(data: tuple[tuple[str, ...], np.ndarray]) -> str:
+    """Gets the top crates after moving them one at a time.
 
-    part_one_crates = copy.deepcopy(crates)
-    part_two_crates = copy.deepcopy(crates)
+    Args:
+        data (tuple[tuple[str, ...], np.ndarray]): the crates and the moves
 
-    # part one
-    for move in moves:
-        _process_single_move(move, part_one_crates)
+    Returns:
+        str: the top crate of each stack
+    """
+    crates, moves = data
+    stacks = [list(stack) for stack in crates]
+    for count, source, destination in moves.tolist():
+        _process_single_move(count, stacks[source], stacks[destination])
+    return "".join(stack[-1] for stack in stacks)
 
-    message = ""
-    for key in part_one_crates:
-        message += part_one_crates[key][-1]
-    print(message)
 
-    # part two
-    for move in moves:
-        _process_multi_move(move, part_two_crates)
+def part_two(data: tuple[tuple[str, ...], np.ndarray]) -> str:
+    """Gets the top crates after moving them several at a time.
 
-    message = ""
-    for key in part_two_crates:
-        message += part_two_crates[key][-1]
-    print(message)
+    Args:
+        data (tuple[tuple[str, ...], np.ndarray]): the crates and the moves
+
+    Returns:
+        str: the top crate of each stack
+    """
+    crates, moves = data
+    stacks = [list(stack) for stack in crates]
+    for count, source, destination in moves.tolist():
+        _process_multi_move(count, stacks[source], stacks[destination])
+    return "".join(stack[-1] for stack in stacks)
+
+
+if __name__ == "__main__":
+    data = parse(inputs.get_input(__file__))
+    print(part_one(data))
+    print(part_two(data))
@@ -0,0 +1,39 @@
+"""Input generator for Advent of Code 2022 Day 5."""
+
+import random
+from collections.abc import Iterator
+from string import ascii_uppercase
+
+STACKS = 9
+BASE_HEIGHT = 8
+BASE_MOVES = 500
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Both the height of the stacks and the number of moves grow with the scale. The moves are simulated as
+    they're generated so that a move always leaves at least one crate on the source stack.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    max_height = BASE_HEIGHT * scale
+    heights = [rng.randint(2, max_height) for _ in range(STACKS)]
+
+    for row in range(max(heights), 0, -1):
+        yield " ".join(f"[{rng.choice(ascii_uppercase)}]" if height >= row else "   " for height in heights)
+    yield " ".join(f" {column} " for column in range(1, STACKS + 1))
+    yield ""
+
+    for _ in range(BASE_MOVES * scale):
+        source = rng.choice([idx for idx, height in enumerate(heights) if height > 1])
+        destination = rng.choice([idx for idx in range(STACKS) if idx != source])
+        count = rng.randint(1, min(heights[source] - 1, max(BASE_HEIGHT, max_height // 4)))
+        heights[source] -= count
+        heights[destination] += count
+        yield f"move {count} from {source + 1} to {destination + 1}"
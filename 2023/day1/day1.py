@@ -1,7 +1,88 @@
 """Advent of Code 2023 Day 1."""
 
+import re
+from collections.abc import Iterable
+
 from advent_of_code.util import inputs
 
+SPELLED = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+PART_ONE_TOKENS = {str(value): value for value in range(1, 10)}
+PART_TWO_TOKENS = PART_ONE_TOKENS | {word: value for value, word in enumerate(SPELLED, 1)}
+
+
+class DigitScanner:
+    """Finds the first and last digit of calibration lines with a pair of precompiled patterns.
+
+    Each pattern lazily skips to the first token on a line and stops there, so only the characters before the
+    first match are looked at. The last token is found the same way by scanning the reversed text for the
+    reversed tokens, which also handles overlaps like "twone" correctly from either end.
+    """
+
+    def __init__(self, tokens: dict[str, int]) -> None:
+        """Initialisation method.
+
+        Args:
+            tokens (dict[str, int]): the value of every token that counts as a digit
+        """
+        self.values = tokens | {token[::-1]: value for token, value in tokens.items()}
+        self.first = self._compile(tokens)
+        self.last = self._compile(token[::-1] for token in tokens)
+
+    @staticmethod
+    def _compile(tokens: Iterable[str]) -> re.Pattern[str]:
+        """Compiles a pattern matching from the start of each line up to the first token on it."""
+        # longest first so that no token is shadowed by one of its prefixes
+        alternatives = "|".join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+        return re.compile(f"^.*?({alternatives})", re.MULTILINE)
+
+    def _scan(self, pattern: re.Pattern[str], text: str) -> list[int]:
+        """Gets the value of the first token on every line of the text."""
+        return [self.values[token] for token in pattern.findall(text)]
+
+    def calibration_value(self, line: str) -> int:
+        """Gets the calibration value of a single line.
+
+        Args:
+            line (str): the line
+
+        Raises:
+            ValueError: if the line has no digit
+
+        Returns:
+            int: the first digit followed by the last digit as a two digit number
+        """
+        first = self.first.search(line)
+        if first is None:
+            msg = f"No digit in line: {line!r}."
+            raise ValueError(msg)
+        last = self.last.search(line[::-1])
+        return 10 * self.values[first.group(1)] + self.values[last.group(1)]
+
+    def calibration_total(self, lines: list[str]) -> int:
+        """Gets the sum of the calibration values of all the lines in two scans over the whole input.
+
+        The last digits come out in reverse line order, which doesn't matter for the sum.
+
+        Args:
+            lines (list[str]): the lines
+
+        Raises:
+            ValueError: if any line has no digit
+
+        Returns:
+            int: the sum of every line's calibration value
+        """
+        text = "\n".join(lines)
+        firsts = self._scan(self.first, text)
+        if len(firsts) != len(lines):
+            msg = f"Only {len(firsts)} of the {len(lines)} lines have a digit."
+            raise ValueError(msg)
+        return 10 * sum(firsts) + sum(self._scan(self.last, text[::-1]))
+
+
+_PART_ONE_SCANNER = DigitScanner(PART_ONE_TOKENS)
+_PART_TWO_SCANNER = DigitScanner(PART_TWO_TOKENS)
+
 
 def _process_line_part_one(line: str) -> int:
     """Calculates the value of the line.
@@ -14,19 +95,10 @@ def _process_line_part_one(line: str) -> int:
     Returns:
         int: the total sum for this line
     """
-    nums = []
-    for index in line:
-        try:
-            num = int(index)
-            nums.append(num)
-        except ValueError:
-            continue
-    first = nums[0]
-    last = nums[-1]
-    return int(f"{first}{last}")
-
-
-def _process_line_part_two(line: str) -> int:  # noqa: PLR0912,C901
+    return _PART_ONE_SCANNER.calibration_value(line)
+
+
+def _process_line_part_two(line: str) -> int:
     """Calculates the value of the line.
 
     According to part 2 of day 1.
@@ -37,56 +109,41 @@ def _process_line_part_two(line: str) -> int:  # noqa: PLR0912,C901
     Returns:
         int: the total sum for this line
     """
-    nums = []
-    for index in range(len(line)):
-        try:
-            num = int(line[index])
-            nums.append(num)
-        except ValueError:
-            # not a number - do second part
-            match line[index]:
-                case "o":
-                    if line[index + 1 : index + 3] == "ne":
-                        nums.append(1)
-                case "t":
-                    if line[index + 1 : index + 3] == "wo":
-                        nums.append(2)
-                    elif line[index + 1 : index + 5] == "hree":
-                        nums.append(3)
-                case "f":
-                    if line[index + 1 : index + 4] == "our":
-                        nums.append(4)
-                    elif line[index + 1 : index + 4] == "ive":
-                        nums.append(5)
-                case "s":
-                    if line[index + 1 : index + 3] == "ix":
-                        nums.append(6)
-                    elif line[index + 1 : index + 5] == "even":
-                        nums.append(7)
-                case "e":
-                    if line[index + 1 : index + 5] == "ight":
-                        nums.append(8)
-                case "n":
-                    if line[index + 1 : index + 4] == "ine":
-                        nums.append(9)
-                case _:
-                    continue
-    first = nums[0]
-    last = nums[-1]
-    return int(f"{first}{last}")
+    return _PART_TWO_SCANNER.calibration_value(line)
 
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+def parse(lines: list[str]) -> list[str]:
+    """Parses the input into the calibration lines; the scanners work on the whole input at once."""
+    return lines
 
-    numbers = []
-    for line in lines:
-        num = _process_line_part_one(line)
-        numbers.append(num)
-    print(f"Part One total was: {sum(numbers)}")
 
-    numbers = []
+def part_one(lines: list[str]) -> int:
+    """Gets the sum of the calibration values using digits only."""
+    return _PART_ONE_SCANNER.calibration_total(lines)
+
+
+def part_two(lines: list[str]) -> int:
+    """Gets the sum of the calibration values using digits and spelled out digits."""
+    return _PART_TWO_SCANNER.calibration_total(lines)
+
+
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines.
+
+    Args:
+        lines (Iterable[str]): the input lines
+
+    Returns:
+        tuple[int, int]: the answers to part one and part two
+    """
+    part_one_total, part_two_total = 0, 0
     for line in lines:
-        num = _process_line_part_two(line)
-        numbers.append(num)
-    print(f"Part two total was: {sum(numbers)}")
+        part_one_total += _process_line_part_one(line)
+        part_two_total += _process_line_part_two(line)
+    return part_one_total, part_two_total
+
+
+if __name__ == "__main__":
+    lines = parse(inputs.get_input(__file__))
+    print(f"Part One total was: {part_one(lines)}")
+    print(f"Part two total was: {part_two(lines)}")
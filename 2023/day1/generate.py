@@ -0,0 +1,36 @@
+"""Input generator for Advent of Code 2023 Day 1."""
+
+import random
+from collections.abc import Iterator
+from string import ascii_lowercase, digits
+
+BASE_LINES = 1000
+SPELLED = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+def _token(rng: random.Random) -> str:
+    """Generates a random chunk of a line: a letter, a digit or a spelled digit."""
+    roll = rng.random()
+    if roll < 0.15:  # noqa: PLR2004
+        return rng.choice(digits[1:])
+    if roll < 0.3:  # noqa: PLR2004
+        return rng.choice(SPELLED)
+    return rng.choice(ascii_lowercase)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Every line has at least one real digit so that both parts have an answer.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    for _ in range(BASE_LINES * scale):
+        tokens = [_token(rng) for _ in range(rng.randint(2, 20))]
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(digits[1:]))
+        yield "".join(tokens)
@@ -1,5 +1,10 @@
 """Advent of Code 2023 Day 2."""
 
+import re
+from collections.abc import Iterable, Iterator
+from itertools import chain
+
+import numpy as np
 from advent_of_code.util import inputs
 
 _MIN_RED = 12
@@ -7,132 +12,120 @@ _MIN_GREEN = 13
 _MIN_BLUE = 14
 
 
-def _process_round_part_one(rnd: str) -> bool:
-    """Processes a given round for part one.
+COLOURS = ("red", "green", "blue")
+# a game's number or a single count of cubes; colours only need their first letter to tell them apart
+_TOKENS = re.compile(r"Game (\d+)|(\d+) ([rgb])")
+
+
+def _max_cubes(text: str) -> Iterator[tuple[int, int, int, int]]:
+    """Finds the most cubes of each colour shown in every game.
+
+    A single pass over the text with one compiled pattern, so it works on a line or a whole input at once.
+
+    Args:
+        text (str): one or more lines of games
+
+    Yields:
+        Iterator[tuple[int, int, int, int]]: each game's number and the most red, green, and blue cubes shown
+    """
+    game, red, green, blue = None, 0, 0, 0
+    for match in _TOKENS.finditer(text):
+        game_num, count_txt, colour = match.groups()
+        if game_num:
+            if game is not None:
+                yield game, red, green, blue
+            game, red, green, blue = int(game_num), 0, 0, 0
+            continue
+        count = int(count_txt)
+        if colour == "r":
+            if count > red:
+                red = count
+        elif colour == "g":
+            if count > green:
+                green = count
+        elif count > blue:
+            blue = count
+    if game is not None:
+        yield game, red, green, blue
+
+
+def _is_possible(red: int, green: int, blue: int) -> bool:
+    """Checks if a game is possible.
 
     Checks to see if it would have been possible for the bag to contain
     no more than 12 red, 13 green, and 14 blue cubes.
 
-    Input in the format:
-        3 blue, 4 red
-        1 red, 2 green
-        3 green, 15 blue, 14 red
-
     Args:
-        rnd (str): the round in the above format
+        red (int): the most red cubes shown in the game
+        green (int): the most green cubes shown in the game
+        blue (int): the most blue cubes shown in the game
 
     Returns:
         bool: whether it would have been possible or not
     """
-    cubes_txt = rnd.strip().split(", ")
-    for cube_type in cubes_txt:
-        num, colour = cube_type.split(" ")
-        match colour:
-            case "red":
-                if int(num) > _MIN_RED:
-                    return False
-            case "green":
-                if int(num) > _MIN_GREEN:
-                    return False
-            case "blue":
-                if int(num) > _MIN_BLUE:
-                    return False
-    return True
-
-
-def _process_round_part_two(rnd: str) -> tuple[int, int, int]:
-    """Processes a given round for part two.
-
-    Counts the number of red, green, and blue cubes for each round.
-
-    Input in the format:
-        3 blue, 4 red
-        1 red, 2 green
-        3 green, 15 blue, 14 red
+    return red <= _MIN_RED and green <= _MIN_GREEN and blue <= _MIN_BLUE
+
+
+def _totals(games: Iterable[tuple[int, int, int, int]]) -> tuple[int, int]:
+    """Gets the answers to both parts from the most cubes shown in each game.
+
+    The most cubes of each colour shown are also the fewest the bag could have held, so their product is
+    the game's power.
 
     Args:
-        rnd (str): the round in the above format
+        games (Iterable[tuple[int, int, int, int]]): each game's number and the most red, green, and blue cubes
 
     Returns:
-        tuple[int, int, int]: the number of red, green, and blue cubes
+        tuple[int, int]: the sum of the possible games' numbers and the sum of the games' powers
     """
-    cubes_txt = rnd.strip().split(", ")
-    red, green, blue = 0, 0, 0
-    for cube_type in cubes_txt:
-        num, colour = cube_type.split(" ")
-        match colour:
-            case "red":
-                red = int(num)
-            case "green":
-                green = int(num)
-            case "blue":
-                blue = int(num)
-    return red, green, blue
-
-
-def _process_line_part_one(line: str) -> int:
-    """Processes a given line for part one.
-
-    Checks if all the rounds in a game are possible to play with
-    12 red, 13 green, and 14 blue cubes. Returns 0 if not possible or the
-    game number if it is possible.
+    valid_games, powers = 0, 0
+    for game_num, red, green, blue in games:
+        if _is_possible(red, green, blue):
+            valid_games += game_num
+        powers += red * green * blue
+    return valid_games, powers
+
+
+def parse(lines: list[str]) -> np.ndarray:
+    """Parses the input into the most cubes shown in each game.
+
+    The whole input is scanned for games and counts of cubes in a single pass, and the parts are then reductions
+    over the resulting array.
 
     Args:
-        line (str): the line to process
+        lines (list[str]): the input lines
 
     Returns:
-        int: the game number if possible, or 0
+        np.ndarray: (n, 4) array of each game's number and the most red, green, and blue cubes shown
     """
-    game_txt, games_txt = line.split(":")
-    game_num = int(game_txt.split(" ")[1])
+    maxima = list(_max_cubes("\n".join(lines)))
+    return np.array(maxima, dtype=np.int64).reshape(-1, 1 + len(COLOURS))
 
-    rounds = games_txt.split("; ")
-    for rnd in rounds:
-        possible = _process_round_part_one(rnd)
-        if not possible:
-            return 0
-    return game_num
 
+def part_one(games: np.ndarray) -> int:
+    """Gets the sum of the game numbers of the possible games."""
+    possible = (games[:, 1:] <= (_MIN_RED, _MIN_GREEN, _MIN_BLUE)).all(axis=1)
+    return int(games[possible, 0].sum())
 
-def _process_line_part_two(line: str) -> int:
-    """Processes a given line for part two.
 
-    Finds the minimum number of red, green, and blue cubes needed
-    for a given game. Multiples these together to produce the power of a game.
+def part_two(games: np.ndarray) -> int:
+    """Gets the sum of the powers of the games."""
+    return int(games[:, 1:].prod(axis=1).sum())
+
+
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines.
 
     Args:
-        line (str): the line to process
+        lines (Iterable[str]): the input lines
 
     Returns:
-        int: the game's power
+        tuple[int, int]: the answers to part one and part two
     """
-    game_txt, games_txt = line.split(":")
-    int(game_txt.split(" ")[1])
-
-    rounds = games_txt.split("; ")
-    min_red, min_green, min_blue = 0, 0, 0
-    for rnd in rounds:
-        red, green, blue = _process_round_part_two(rnd)
-        min_red = max(min_red, red)
-        min_green = max(min_green, green)
-        min_blue = max(min_blue, blue)
-
-    return min_red * min_green * min_blue
+    return _totals(chain.from_iterable(map(_max_cubes, lines)))
 
 
 if __name__ == "__main__":
-    lines = inputs.get_input()
-
-    # part one
-    games = []
-    for line in lines:
-        num = _process_line_part_one(line)
-        games.append(num)
-    print(f"Sum of valid games is: {sum(games)}")
-
-    # part two
-    powers = []
-    for line in lines:
-        num = _process_line_part_two(line)
-        powers.append(num)
-    print(f"Powers of all games is: {sum(powers)}.")
+    games = parse(inputs.get_input(__file__))
+    print(f"Sum of valid games is: {part_one(games)}")
+    print(f"Powers of all games is: {part_two(games)}.")
@@ -0,0 +1,27 @@
+"""Input generator for Advent of Code 2023 Day 2."""
+
+import random
+from collections.abc import Iterator
+
+BASE_GAMES = 100
+COLOURS = ("red", "green", "blue")
+
+
+def _round(rng: random.Random) -> str:
+    """Generates a single round of a game."""
+    colours = rng.sample(COLOURS, rng.randint(1, len(COLOURS)))
+    return ", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    for game in range(1, BASE_GAMES * scale + 1):
+        yield f"Game {game}: " + "; ".join(_round(rng) for _ in range(rng.randint(1, 6)))
@@ -1,170 +1,127 @@
 """Advent of Code 2023 Day 3."""
 
-from advent_of_code.util import inputs
+import numpy as np
+from advent_of_code.util import cache, inputs, profiling
+from advent_of_code.util.grid import Grid
 
 ADJACENT_GEAR_NUMBERS = 2
+ADJACENCY = tuple((d_x, d_y) for d_x in (-1, 0, 1) for d_y in (-1, 0, 1))
 
 
-class Num:
-    """Represents a number in our grid.
+GEAR = "*"
 
-    Each number is at least one digit long. Each digit has a separte co-ordinate
-    in our grid.
-    """
-
-    def __init__(self, value: int, coords: list[tuple[int, int]]) -> "Num":
-        """Initialiser."""
-        self.coords = coords
-        self.value = value
-
-    def __repr__(self) -> str:
-        """Nicer printing."""
-        return f"{self.value}: {self.coords}"
 
+def _find_numbers(grid: Grid) -> tuple[np.ndarray, np.ndarray]:
+    """Finds all the numbers in the grid.
 
-def _make_grid(lines: list[str]) -> list[list[str]]:
-    """Turns out list of lines into a grid.
+    Also returns an index of which number each cell belongs to, so the number at a co-ordinate can be
+    looked up directly rather than searching through every number's co-ordinates.
 
     Args:
-        lines (list[str]): a list of lines to process
+        grid (Grid): the grid to process
 
     Returns:
-        list[list[str]]: our grid
+        tuple[np.ndarray, np.ndarray]: the value of each number and the index; each cell holds the position
+            of its number plus one, or 0 if it isn't a digit
     """
-    grid: list[list[str]] = []
-    for x in range(len(lines)):
-        grid.append([])
-        line = lines[x]
-        for y in line:
-            grid[x].append(y)
-    return grid
+    labels, _ = grid.label_runs(grid.digit_mask())
+    return grid.run_numbers(labels), labels
 
 
-def _find_numbers(grid: list[list[str]]) -> list[Num]:
-    """Finds all the numbers in the grid.
+def _find_gears(grid: Grid) -> np.ndarray:
+    """Finds the co-ordinates of all the possible gears in the grid.
 
     Args:
-        grid (list[list[str]]): the grid to process
+        grid (Grid): the grid to find gears in
 
     Returns:
-        list[Num]: the list of Nums representing the numbers
+        np.ndarray: (n, 2) array of the co-ordinates of every gear symbol
     """
-    numbers: list[Num] = []
-    for x in range(len(grid)):
-        coords = []
-        number = False
-        value = ""
-        row = grid[x]
-        for y in range(len(row)):
-            item = grid[x][y]
-            if item.isnumeric():
-                coords.append((x, y))
-                value += item
-                number = True
-            else:
-                if number:
-                    num = Num(int(value), coords)
-                    numbers.append(num)
-                number = False
-                value = ""
-                coords = []
-        if number:
-            num = Num(int(value), coords)
-            numbers.append(num)
-    return numbers
-
-
-def _find_symbols(grid: list[list[str]]) -> dict[tuple, str]:
-    """Finds all the symbols in the grid.
-
-    Returns the symbols as a dictionary with the co-ordinates as keys (unique) and the given
-    symbol as the values.
+    return np.argwhere(grid.char_mask(GEAR))
+
+
+@profiling.track
+def _find_adjacent_numbers(symbol_coords: tuple[int, int], numbers: np.ndarray, index: np.ndarray) -> list[int]:
+    """Given a symbol co-ordinate, find the adjacent numbers.
 
     Args:
-        grid (list[list[str]]): the grid to find symbols in.
+        symbol_coords (tuple[int, int]): the coord of the symbol
+        numbers (np.ndarray): the value of each number
+        index (np.ndarray): the number index from `_find_numbers`
 
     Returns:
-        dict[tuple, str]: the found symbols
+        list[int]: the values of the adjacent numbers
     """
-    symbols: dict[tuple, str] = {}
-    for x in range(len(grid)):
-        for y in range(len(grid[x])):
-            if grid[x][y] != "." and not grid[x][y].isnumeric():
-                # y is a symbol
-                symbols[(x, y)] = grid[x][y]
-    return symbols
+    height, width = index.shape
+    adjacent_ids: list[int] = []
+    for d_x, d_y in ADJACENCY:
+        x = symbol_coords[0] + d_x
+        y = symbol_coords[1] + d_y
 
+        if x < 0 or y < 0 or x >= height or y >= width:
+            # skip out of bounds
+            continue
 
-def _find_adjacent_numbers(symbol_coords: tuple[int, int], numbers: list[Num], grid: list[list[str]]) -> list[Num]:
-    """Given a symbol co-ordinate, find the adjacent numbers.
+        number_id = int(index[x, y])
+        if number_id and number_id not in adjacent_ids:
+            adjacent_ids.append(number_id)
+    return [int(numbers[number_id - 1]) for number_id in adjacent_ids]
+
+
+@cache.cached_parse
+def parse(lines: list[str]) -> tuple[Grid, np.ndarray, np.ndarray, np.ndarray]:
+    """Parses the input into the grid, the numbers, the gears and the number index.
 
     Args:
-        symbol_coords (tuple[int, int]): the coord of the symbol
-        numbers (list[Num]): the list of numbers
-        grid (list[list[str]]): the grid
+        lines (list[str]): the input lines
 
     Returns:
-        list[Num]: the list of adjacent numbers
+        tuple[Grid, np.ndarray, np.ndarray, np.ndarray]: the grid, the numbers, the gears and the index
     """
-    adjacency = [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 0),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]
-
-    adjacent_numbers = []
-    for vector in adjacency:
-        x = symbol_coords[0] + vector[0]
-        y = symbol_coords[1] + vector[1]
-
-        if x < 0 or y < 0 or x >= len(grid) or y >= len(grid):
-            # skip out of bounds
-            continue
+    grid = Grid.from_lines(lines)
+    numbers, index = _find_numbers(grid)
+    return grid, numbers, _find_gears(grid), index
 
-        item: str = grid[x][y]
-        if not item.isnumeric():
-            continue
 
-        # else find the corresponding number
-        num = next(number for number in numbers if (x, y) in number.coords)
-        if num not in adjacent_numbers:
-            adjacent_numbers.append(num)
-    return adjacent_numbers
+def part_one(data: tuple[Grid, np.ndarray, np.ndarray, np.ndarray]) -> int:
+    """Gets the sum of all the numbers adjacent to a symbol.
 
+    Works on the whole grid at once with masks rather than symbol by symbol.
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+    Args:
+        data (tuple[Grid, np.ndarray, np.ndarray, np.ndarray]): the grid, the numbers, the gears and the index
 
-    grid = _make_grid(lines)
-    numbers = _find_numbers(lines)
-    symbols = _find_symbols(grid)
+    Returns:
+        int: the sum of the part numbers
+    """
+    grid, numbers, _, index = data
+    # pick out the numbers of any digit touching a symbol
+    adjacent = np.unique(index[grid.dilate(grid.symbol_mask()) & (index > 0)])
+    return int(numbers[adjacent - 1].sum())
 
-    # part one
-    valid_numbers: list[Num] = []
-    for symbol_coord in symbols:
-        adjacent_nums = _find_adjacent_numbers(symbol_coord, numbers, grid)
-        for num in adjacent_nums:
-            if num not in valid_numbers:
-                valid_numbers.append(num)
 
-    print(sum([v.value for v in valid_numbers]))
+def part_two(data: tuple[Grid, np.ndarray, np.ndarray, np.ndarray]) -> int:
+    """Gets the sum of the gear ratios.
+
+    Args:
+        data (tuple[Grid, np.ndarray, np.ndarray, np.ndarray]): the grid, the numbers, the gears and the index
 
-    # part two
+    Returns:
+        int: the sum of the gear ratios
+    """
+    _, numbers, gears, index = data
     gear_ratios: list[int] = []
-    for symbol_coord in symbols:
-        if symbols[symbol_coord] != "*":
-            # not a gear
-            continue
-        adjacent_nums = _find_adjacent_numbers(symbol_coord, numbers, grid)
+    for gear in gears.tolist():
+        adjacent_nums = _find_adjacent_numbers(gear, numbers, index)
         if len(adjacent_nums) != ADJACENT_GEAR_NUMBERS:
             # not a gear
             continue
-        gear_ratios.append(adjacent_nums[0].value * adjacent_nums[1].value)
+        gear_ratios.append(adjacent_nums[0] * adjacent_nums[1])
 
-    print(sum(gear_ratios))
+    return sum(gear_ratios)
+
+
+if __name__ == "__main__":
+    data = parse(inputs.get_input(__file__))
+    print(part_one(data))
+    print(part_two(data))
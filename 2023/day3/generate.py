@@ -0,0 +1,52 @@
+"""Input generator for Advent of Code 2023 Day 3."""
+
+import math
+import random
+from collections.abc import Iterator
+
+BASE_SIZE = 140
+SYMBOLS = "*#+$/@=%&-"
+
+
+def _row(size: int, rng: random.Random) -> str:
+    """Generates a single row of the grid.
+
+    Roughly matches the density of a real input: mostly empty cells with 1-3 digit numbers and symbols.
+
+    Args:
+        size (int): the width of the row
+        rng (random.Random): the seeded random generator to use
+
+    Returns:
+        str: the row
+    """
+    cells = []
+    while len(cells) < size:
+        roll = rng.random()
+        if roll < 0.08 and not (cells and cells[-1].isdigit()):  # noqa: PLR2004
+            cells.extend(str(rng.randint(1, 999)))
+        elif roll < 0.13:  # noqa: PLR2004
+            cells.append(rng.choice(SYMBOLS))
+        else:
+            cells.append(".")
+    if cells[size - 1].isdigit() and size < len(cells) and cells[size].isdigit():
+        # don't cut a number in half at the edge
+        cells[size - 1] = "."
+    return "".join(cells[:size])
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    The grid is square and its area grows with the scale.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    size = round(BASE_SIZE * math.sqrt(scale))
+    for _ in range(size):
+        yield _row(size, rng)
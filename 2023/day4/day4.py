@@ -3,101 +3,106 @@
 from advent_of_code.util import inputs
 
 
-def _card_representation(line: str) -> tuple[int, dict[str]]:
+def _card_representation(line: str) -> tuple[int, tuple[set[int], set[int]]]:
     """Converts a line into a card representation.
 
     Args:
         line (str): the line to parse
 
     Returns:
-        tuple[int, dict[str]]: the card number and card dict
+        tuple[int, tuple[set[int], set[int]]]: the card number and the winning and actual numbers
     """
     name, numbers_line = line.split(":")
     *_, card_num = name.split(" ")
-    winning, actual = _split_card(numbers_line)
-    card = {"winning": winning, "actual": actual, "count": 1}
-    return int(card_num), card
+    return int(card_num), _split_card(numbers_line)
 
 
-def _split_card(line: str) -> tuple[list[int], list[int]]:
+def _split_card(line: str) -> tuple[set[int], set[int]]:
     """Given a line, extracts the winning and actual card numbers.
 
     Args:
         line (str): the line to parse
 
     Returns:
-        tuple[list[int], list[int]]: the winning and actual numbers
+        tuple[set[int], set[int]]: the winning and actual numbers
     """
     winning, actual = line.split("|")
-    winning_numbers = [int(win) for win in winning.strip().split(" ") if win]
-    actual_numbers = [int(act) for act in actual.strip().split(" ") if act]
-    return winning_numbers, actual_numbers
+    return {int(win) for win in winning.split()}, {int(act) for act in actual.split()}
 
 
-def _get_score(winning_numbers: list[int], actual_numbers: list[int]) -> int:
+def _get_winning_count(winning_numbers: set[int], actual_numbers: set[int]) -> int:
+    """Gets winning number of numbers.
+
+    Args:
+        winning_numbers (set[int]): the winning numbers
+        actual_numbers (set[int]): the actual numbers
+
+    Returns:
+        int: the number of winning actual numbers
+    """
+    return len(winning_numbers & actual_numbers)
+
+
+def _get_score(wins: int) -> int:
     """Gets score from a scratchcard.
 
-    For part one.
+    The first win is worth one point and each win after that doubles it.
 
     Args:
-        winning_numbers (list[int]): the winning numbers
-        actual_numbers (list[int]): the actual numbers
+        wins (int): the number of winning actual numbers on the card
 
     Returns:
         int: the score of a given card
     """
-    score = 0
-    for number in actual_numbers:
-        if number in winning_numbers:
-            if not score:
-                score = 1
-            else:
-                score *= 2
-    return score
+    return 1 << (wins - 1) if wins else 0
 
 
-def _get_winning_count(winning_numbers: list[int], actual_numbers: list[int]) -> int:
-    """Gets winning number of numbers.
+def parse(lines: list[str]) -> list[int]:
+    """Parses the input into the number of wins on each card.
 
-    For part two.
+    The numbers are only needed to count the wins, so that's done once per card here.
 
     Args:
-        winning_numbers (list[int]): the winning numbers
-        actual_numbers (list[int]): the actual numbers
+        lines (list[str]): the input lines
 
     Returns:
-        int: the number of winning actual numbers
+        list[int]: the number of wins on each card, in card order
+    """
+    cards = (_card_representation(line) for line in lines if line)
+    return [_get_winning_count(winning, actual) for _, (winning, actual) in cards]
+
+
+def part_one(wins: list[int]) -> int:
+    """Gets the total score of the cards."""
+    return sum(map(_get_score, wins))
+
+
+def part_two(wins: list[int]) -> int:
+    """Gets the total number of cards after winning copies.
+
+    Each card adds its number of copies to the next `wins` cards. Rather than adding to each of those
+    individually, the copies are added at the start of the range and taken away after the end of it in a
+    difference array, and the running total gives the copies won by each card.
+
+    Args:
+        wins (list[int]): the number of wins on each card
+
+    Returns:
+        int: the total number of cards
     """
-    score = 0
-    for number in actual_numbers:
-        if number in winning_numbers:
-            score += 1
-    return score
+    differences = [0] * (len(wins) + 1)
+    total, won = 0, 0
+    for card, card_wins in enumerate(wins):
+        won += differences[card]
+        count = 1 + won
+        total += count
+        if card_wins:
+            differences[card + 1] += count
+            differences[min(card + 1 + card_wins, len(wins))] -= count
+    return total
 
 
 if __name__ == "__main__":
-    lines = inputs.get_input()
-
-    # part one
-    total = 0
-    for line in lines:
-        ln = line.split(":")[-1]
-        winning, actual = _split_card(ln)
-        total += _get_score(winning, actual)
-    print(total)
-
-    # part two
-    cards: dict[int, dict[str]] = {}
-    for line in lines:
-        num, card = _card_representation(line)
-        cards[num] = card
-
-    for card_num in cards:
-        print(f"processing {card_num=}")
-        count = cards[card_num]["count"]
-        for _ in range(count):
-            wins = _get_winning_count(cards[card_num]["winning"], cards[card_num]["actual"])
-            for inc in range(wins):
-                cards[card_num + inc + 1]["count"] += 1
-    total_cards = sum([cards[key]["count"] for key in cards])
-    print(total_cards)
+    wins = parse(inputs.get_input(__file__))
+    print(part_one(wins))
+    print(part_two(wins))
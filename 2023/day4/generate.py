@@ -0,0 +1,37 @@
+"""Input generator for Advent of Code 2023 Day 4."""
+
+import random
+from collections.abc import Iterator
+
+BASE_CARDS = 200
+WINNING = 10
+ACTUAL = 25
+NUMBERS = range(1, 100)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Cards never win more copies than there are cards after them.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    total = BASE_CARDS * scale
+    width = len(str(total))
+    for card in range(1, total + 1):
+        wins = rng.randint(0, min(WINNING, total - card))
+        winning = rng.sample(NUMBERS, WINNING)
+        losing = [number for number in NUMBERS if number not in winning]
+        actual = rng.sample(winning, wins) + rng.sample(losing, ACTUAL - wins)
+        rng.shuffle(actual)
+        yield (
+            f"Card {card:>{width}}: "
+            + " ".join(f"{number:>2}" for number in winning)
+            + " | "
+            + " ".join(f"{number:>2}" for number in actual)
+        )
@@ -1,8 +1,19 @@
 """Advent of Code 23 Day 5."""
 
+from bisect import bisect_right
 from itertools import batched
 
-from advent_of_code.util import inputs
+from advent_of_code.util import cache, inputs, profiling
+
+MAP_ORDER = (
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+)
 
 
 def _extract_seeds(line: str) -> list[int]:
@@ -18,22 +29,50 @@ def _extract_seeds(line: str) -> list[int]:
 
 
 def _map_numbers(destination_start: int, source_start: int, length: int) -> tuple[range, range]:
-    """_summary_.
+    """Turns a line of a map into its source and destination ranges.
 
     Args:
-        source_start (int): _description_
-        destination_start (int): _description_
-        length (int): _description_
-        _map (dict[int, int]): _description_
+        destination_start (int): the start of the destination range
+        source_start (int): the start of the source range
+        length (int): the length of both ranges
 
     Returns:
-        dict: _description_
+        tuple[range, range]: the source range and the destination range
     """
     source_range = range(source_start, source_start + length)
     destination_range = range(destination_start, destination_start + length)
     return source_range, destination_range
 
 
+def _parse_maps(lines: list[str]) -> dict[str, dict[range, range]]:
+    """Parses the maps from the input lines.
+
+    Args:
+        lines (list[str]): the input lines after the seeds line
+
+    Returns:
+        dict[str, dict[range, range]]: mapping of map name to the source and destination ranges
+    """
+    maps: dict[str, dict[range, range]] = {}
+    current_map = None
+    for line in lines:
+        if not line:
+            continue
+
+        if "map" in line:
+            # new map!
+            map_name = line.split(" ")[0]
+            if map_name not in maps:
+                maps[map_name] = {}
+            current_map = maps[map_name]
+            continue
+
+        src_rng, dst_rng = _map_numbers(*[int(ln) for ln in line.split(" ")])
+        current_map[src_rng] = dst_rng
+    return maps
+
+
+@profiling.track
 def _get_dst_from_map(num: int, _map: dict[range, range]) -> int | None:
     for key in _map:
         if num in key:
@@ -59,40 +98,117 @@ def _get_seed_location(seed: int, maps: dict[str, dict[range, range]]) -> int:
     return location_num if location_num is not None else hum_num
 
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+def _sorted_ranges(_map: dict[range, range]) -> tuple[list[int], list[tuple[int, int, int]]]:
+    """Sorts a map's ranges by source start.
 
-    seeds = _extract_seeds(lines[0])
-    print(seeds)
+    Args:
+        _map (dict[range, range]): the map
 
-    maps: dict[str, dict[int, int]] = {}
-    current_map = None
-    for line in lines[1:]:
-        if not line:
-            continue
+    Returns:
+        tuple[list[int], list[tuple[int, int, int]]]: the source starts (for bisecting) and the
+            (source start, source end, offset to destination) of each range
+    """
+    ranges = sorted((src.start, src.stop, dst.start - src.start) for src, dst in _map.items())
+    return [src_start for src_start, _, _ in ranges], ranges
 
-        if "map" in line:
-            # new map!
-            map_name = line.split(" ")[0]
-            print(f"Calculating map for {map_name}")
-            if map_name not in maps:
-                maps[map_name] = {}
-            current_map = maps[map_name]
-            continue
 
-        src_rng, dst_rng = _map_numbers(*[int(ln) for ln in line.split(" ")])
-        current_map[src_rng] = dst_rng
+def _merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merges overlapping and touching intervals.
+
+    Args:
+        intervals (list[tuple[int, int]]): half open (start, end) intervals
+
+    Returns:
+        list[tuple[int, int]]: the merged intervals, sorted
+    """
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _map_intervals(intervals: list[tuple[int, int]], _map: dict[range, range]) -> list[tuple[int, int]]:
+    """Pushes whole intervals through a map.
+
+    Each interval is split wherever it crosses the edge of one of the map's ranges. The parts inside a range are
+    shifted to the destination and the parts outside every range map to themselves.
+
+    Args:
+        intervals (list[tuple[int, int]]): half open (start, end) intervals
+        _map (dict[range, range]): the map
+
+    Returns:
+        list[tuple[int, int]]: the mapped intervals, merged
+    """
+    starts, ranges = _sorted_ranges(_map)
+    mapped = []
+    for interval in intervals:
+        start, end = interval
+        # first range that could contain the start
+        idx = max(bisect_right(starts, start) - 1, 0)
+        while start < end:
+            if idx >= len(ranges):
+                # past the last range
+                mapped.append((start, end))
+                break
+            src_start, src_end, offset = ranges[idx]
+            if start >= src_end:
+                idx += 1
+                continue
+            if start < src_start:
+                # in the gap before this range
+                cut = min(end, src_start)
+                mapped.append((start, cut))
+            else:
+                cut = min(end, src_end)
+                mapped.append((start + offset, cut + offset))
+                idx += 1
+            start = cut
+    return _merge_intervals(mapped)
+
+
+@cache.cached_parse
+def parse(lines: list[str]) -> tuple[list[int], dict[str, dict[range, range]]]:
+    """Parses the input into the seeds and the maps.
 
-    # part one
-    locations_part_one = [_get_seed_location(seed, maps) for seed in seeds]
-    print(min(locations_part_one))
-
-    # very inefficient
-    # won't actually finish but run out of memory and die
-    # should _theoretically_ find a solution if unlimited memory and processing power
-    # need to work out how to optimise it to finish it
-    # # part two
-    locations_part_two = []
-    for pair in batched(seeds, 2):
-        locations_part_two.extend(_get_seed_location(seed, maps) for seed in range(pair[0], sum(pair)))
-    print(min(locations_part_two))
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        tuple[list[int], dict[str, dict[range, range]]]: the seeds and the maps
+    """
+    return _extract_seeds(lines[0]), _parse_maps(lines[1:])
+
+
+def part_one(data: tuple[list[int], dict[str, dict[range, range]]]) -> int:
+    """Gets the lowest location of the seeds."""
+    seeds, maps = data
+    return min(_get_seed_location(seed, maps) for seed in seeds)
+
+
+def part_two(data: tuple[list[int], dict[str, dict[range, range]]]) -> int:
+    """Gets the lowest location of the seed ranges.
+
+    Rather than pushing every seed through the maps, the seed ranges are pushed through as whole intervals
+    so the work depends on the number of fragments they split into, not the number of seeds.
+
+    Args:
+        data (tuple[list[int], dict[str, dict[range, range]]]): the seeds and the maps
+
+    Returns:
+        int: the lowest location
+    """
+    seeds, maps = data
+    intervals = _merge_intervals([(start, start + length) for start, length in batched(seeds, 2)])
+    for map_name in MAP_ORDER:
+        intervals = _map_intervals(intervals, maps[map_name])
+    return intervals[0][0]
+
+
+if __name__ == "__main__":
+    data = parse(inputs.get_input(__file__))
+    print(part_one(data))
+    print(part_two(data))
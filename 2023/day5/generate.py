@@ -0,0 +1,64 @@
+"""Input generator for Advent of Code 2023 Day 5."""
+
+import random
+from collections.abc import Iterator
+from itertools import pairwise
+
+BASE_SEED_PAIRS = 10
+BASE_RANGES = 30
+MAX_VALUE = 2**32
+MAX_SEED_RANGE = 2 * 10**9
+MAP_NAMES = (
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+)
+
+
+def _map_lines(count: int, rng: random.Random) -> Iterator[str]:
+    """Generates the 'destination source length' lines for a single map.
+
+    The source ranges never overlap; some of the value space is left unmapped.
+
+    Args:
+        count (int): the number of ranges in the map
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the map lines
+    """
+    bounds = sorted(rng.sample(range(MAX_VALUE), count + 1))
+    for start, end in pairwise(bounds):
+        if rng.random() < 0.1:  # noqa: PLR2004
+            # leave a gap that maps to itself
+            continue
+        length = end - start
+        yield f"{rng.randrange(MAX_VALUE - length)} {start} {length}"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Seed ranges are up to two billion wide.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    seeds = []
+    for _ in range(BASE_SEED_PAIRS * scale):
+        length = rng.randint(1, MAX_SEED_RANGE)
+        seeds.extend((rng.randrange(MAX_VALUE - length), length))
+    yield "seeds: " + " ".join(str(seed) for seed in seeds)
+
+    for name in MAP_NAMES:
+        yield ""
+        yield f"{name} map:"
+        yield from _map_lines(BASE_RANGES * scale, rng)
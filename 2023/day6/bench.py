@@ -0,0 +1,116 @@
+"""Benchmark of the closed form race solver for Advent of Code 2023 Day 6 against brute force.
+
+Times races of increasing length with both solvers. Brute force tries every hold time, so it's only run up to
+`--brute-force-limit`; beyond that the closed form's answer is checked by confirming the hold times either
+side of each boundary lose and the boundaries themselves win.
+
+Usage:
+    python -m advent_of_code.2023.day6.bench --max-exponent 18 --seed 1
+"""
+
+import argparse
+import importlib
+import random
+import time
+from collections.abc import Callable
+
+day6 = importlib.import_module("advent_of_code.2023.day6.day6")
+
+DEFAULT_MAX_EXPONENT = 18
+DEFAULT_BRUTE_FORCE_LIMIT = 10**7
+DEFAULT_SEED = 0
+
+
+def _count_winning_times_brute_force(time: int, distance: int) -> int:
+    """Counts the winning hold times by trying every one of them."""
+    return sum(1 for hold_time in range(time + 1) if day6._check_winning_time(time, distance, hold_time))  # noqa: SLF001
+
+
+def _check_boundaries(time: int, distance: int, count: int) -> bool:
+    """Checks a count from the closed form by testing the hold times around where the winners must start and end.
+
+    Args:
+        time (int): the time
+        distance (int): the record distance to beat
+        count (int): the number of winning hold times to check
+
+    Returns:
+        bool: whether the count is consistent with the boundaries
+    """
+    check = day6._check_winning_time  # noqa: SLF001
+    if not count:
+        return not check(time, distance, time // 2)
+    lowest = (time - count + 1) // 2
+    highest = lowest + count - 1
+    return (
+        check(time, distance, lowest)
+        and check(time, distance, highest)
+        and not check(time, distance, lowest - 1)
+        and not check(time, distance, highest + 1)
+    )
+
+
+def _timed(func: Callable[[int, int], int], time_: int, distance: int) -> tuple[int, float]:
+    """Calls the solver and times it.
+
+    Args:
+        func (Callable[[int, int], int]): the solver
+        time_ (int): the race time
+        distance (int): the record distance
+
+    Returns:
+        tuple[int, float]: the count and the seconds taken
+    """
+    start = time.perf_counter()
+    count = func(time_, distance)
+    return count, time.perf_counter() - start
+
+
+def bench(max_exponent: int, brute_force_limit: int, rng: random.Random) -> list[str]:
+    """Benchmarks both solvers on one race for each power of ten up to the max.
+
+    Args:
+        max_exponent (int): the largest race time is 10 to the power of this
+        brute_force_limit (int): the largest race time to run brute force on
+        rng (random.Random): the seeded random generator for the record distances
+
+    Raises:
+        AssertionError: if the solvers disagree or the closed form's boundaries are wrong
+
+    Returns:
+        list[str]: a line of the report for each race
+    """
+    report = [f"{'time':>20} {'closed form':>14} {'brute force':>14}  ways to win"]
+    for exponent in range(1, max_exponent + 1):
+        race_time = 10**exponent
+        # somewhere between a trivial record and one that's barely beatable
+        distance = rng.randint(race_time, race_time * race_time // 4 - 1)
+
+        count, closed_form = _timed(day6._count_winning_times, race_time, distance)  # noqa: SLF001
+        if not _check_boundaries(race_time, distance, count):
+            msg = f"Closed form boundaries are wrong for time={race_time} distance={distance}."
+            raise AssertionError(msg)
+
+        brute_force = "-"
+        if race_time <= brute_force_limit:
+            expected, seconds = _timed(_count_winning_times_brute_force, race_time, distance)
+            if count != expected:
+                msg = f"Solvers disagree for time={race_time} distance={distance}: {count} != {expected}."
+                raise AssertionError(msg)
+            brute_force = f"{seconds * 1000:11.3f} ms"
+        report.append(f"{race_time:>20} {closed_form * 1000:11.3f} ms {brute_force:>14}  {count}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the closed form race solver against brute force.")
+    parser.add_argument(
+        "--max-exponent", type=int, default=DEFAULT_MAX_EXPONENT, help="largest race time as a power of ten"
+    )
+    parser.add_argument(
+        "--brute-force-limit", type=int, default=DEFAULT_BRUTE_FORCE_LIMIT, help="largest race time to brute force"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed")
+
+    args = parser.parse_args()
+    print("\n".join(bench(args.max_exponent, args.brute_force_limit, random.Random(args.seed))))
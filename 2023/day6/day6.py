@@ -1,6 +1,8 @@
 """Advent of Code 2023 Day 6."""
 
 import math
+from collections.abc import Iterable
+from itertools import starmap
 
 from advent_of_code.util import inputs
 
@@ -29,58 +31,98 @@ def _get_distances(line: str) -> list[int]:
     return [int(pt) for pt in line[9:].split(" ") if pt]
 
 
-def _get_winning_times(time: int, distance: int) -> list[int]:
-    """Gets the winning times.
+def _check_winning_time(time: int, distance: int, hold_time: int) -> bool:
+    """Checks a given time is a winning time.
 
     Args:
         time (int): the time
-        distance (int): the record distance
+        distance (int): the record distance to beat
+        hold_time (int): the hold time to check
 
     Returns:
-        list[int]: list of winning times
+        bool: whether this hold time can beat the record or not
     """
-    return [hold_time for hold_time in range(1, time - 1) if _check_winning_time(time, distance, hold_time)]
+    return hold_time * (time - hold_time) > distance
 
 
-def _check_winning_time(time: int, distance: int, hold_time: int) -> bool:
-    """Checks a given time is a winning time.
+def _count_winning_times(time: int, distance: int) -> int:
+    """Counts the winning hold times without trying each of them.
+
+    The hold times that win are those strictly between the roots of `h * (time - h) = distance`, which is
+    symmetric around `time / 2`. The lowest winner is estimated from the exact integer square root of the
+    discriminant and then nudged onto the boundary, which takes at most a couple of steps, so this works on
+    arbitrarily large integers without any floating point error.
 
     Args:
         time (int): the time
         distance (int): the record distance to beat
-        hold_time (int): the hold time to check
 
     Returns:
-        bool: whether this hold time can beat the record or not
+        int: the number of winning hold times
     """
-    return hold_time * (time - hold_time) > distance
+    discriminant = time * time - 4 * distance
+    if discriminant <= 0 or not _check_winning_time(time, distance, time // 2):
+        # even the best hold time can't beat the record
+        return 0
 
+    lowest = max(0, (time - math.isqrt(discriminant)) // 2)
+    while not _check_winning_time(time, distance, lowest):
+        lowest += 1
+    while lowest > 0 and _check_winning_time(time, distance, lowest - 1):
+        lowest -= 1
+    # the highest winner is the mirror image of the lowest
+    return time - 2 * lowest + 1
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
 
-    # part one
-    times = _get_times(lines[0])
-    distances = _get_distances(lines[1])
-    print(math.prod(len(_get_winning_times(*race)) for race in zip(times, distances, strict=True)))
+def parse(lines: list[str]) -> tuple[list[int], list[int]]:
+    """Parses the input into the race times and record distances.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        tuple[list[int], list[int]]: the times and the distances
+    """
+    return _get_times(lines[0]), _get_distances(lines[1])
 
-    # part two
+
+def part_one(data: tuple[list[int], list[int]]) -> int:
+    """Gets the product of the number of ways to win each race."""
+    times, distances = data
+    return math.prod(starmap(_count_winning_times, zip(times, distances, strict=True)))
+
+
+def part_two(data: tuple[list[int], list[int]]) -> int:
+    """Gets the number of ways to win the single long race.
+
+    Args:
+        data (tuple[list[int], list[int]]): the times and the distances
+
+    Returns:
+        int: the number of ways to win
+    """
+    times, distances = data
     # make it all one time
     time = int("".join(str(t) for t in times))
     distance = int("".join(str(d) for d in distances))
+    return _count_winning_times(time, distance)
+
 
-    lowest = None
-    # find lowest
-    for x in range(1, time - 1):
-        if _check_winning_time(time, distance, x):
-            # first winner!
-            lowest = x - 1
-            break
-
-    highest = None
-    # find highest that will still win
-    for x in range(time - 1, 0, -1):
-        if _check_winning_time(time, distance, x):
-            highest = x
-            break
-    print(highest - lowest)
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts reading only the two lines of the input.
+
+    Args:
+        lines (Iterable[str]): the input lines
+
+    Returns:
+        tuple[int, int]: the answers to part one and part two
+    """
+    lines = iter(lines)
+    data = _get_times(next(lines)), _get_distances(next(lines))
+    return part_one(data), part_two(data)
+
+
+if __name__ == "__main__":
+    data = parse(inputs.get_input(__file__))
+    print(part_one(data))
+    print(part_two(data))
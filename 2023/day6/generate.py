@@ -0,0 +1,28 @@
+"""Input generator for Advent of Code 2023 Day 6."""
+
+import random
+from collections.abc import Iterator
+
+BASE_RACES = 4
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Times have two digits and distances three, so every race (and the single combined race of part two)
+    can be won.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    times, distances = [], []
+    for _ in range(BASE_RACES * scale):
+        time = rng.randint(40, 99)
+        times.append(time)
+        distances.append(rng.randint(100, min(999, time * time // 4 - 1)))
+    yield "Time:     " + " ".join(f"{time:>4}" for time in times)
+    yield "Distance: " + " ".join(f"{distance:>4}" for distance in distances)
@@ -1,10 +1,22 @@
 """Advent of Code 2023 Day 7."""
 
+import functools
 from enum import IntEnum
 
-from advent_of_code.util import inputs
+import numpy as np
+from advent_of_code.util import inputs, profiling
 
 CARD_ORDER = "23456789TJQKA"
+# in part two, J is a joker and the weakest card
+CARD_ORDER_PART_TWO = "J23456789TQKA"
+HAND_SIZE = 5
+# hands are read as base 13 numbers of their cards' ranks
+BASE = len(CARD_ORDER)
+# maps each card to its rank as a byte, for reading whole inputs into arrays
+_CARD_BYTES = str.maketrans(CARD_ORDER, "".join(map(chr, range(BASE))))
+# the rank of each card in CARD_ORDER_PART_TWO, indexed by its rank in CARD_ORDER
+_JOKER_RANKS = np.array([CARD_ORDER_PART_TWO.index(card) for card in CARD_ORDER], dtype=np.int64)
+_POWERS = BASE ** np.arange(HAND_SIZE - 1, -1, -1, dtype=np.int64)
 
 
 class HandType(IntEnum):
@@ -20,158 +32,118 @@ class HandType(IntEnum):
     NONE = 8
 
 
-class Hand:
-    """Represents a hand with it's given bid."""
-
-    def __init__(self, hand: str, bid: int, part_two: bool = False) -> None:
-        """Initialisation method.
-
-        Args:
-            hand (str): the 5 card hand
-            bid (int): the bid associated with the hand
-            part_two (bool, optional): whether to reclassify or not. Defaults to False.
-        """
-        self.hand: str = hand
-        self.bid: int = bid
-        self.part_two = part_two
-        self.hand_type: HandType = self._classify_hand()
-
-        if self.part_two and "J" in self.hand and self.hand_type != HandType.FIVE_OF_A_KIND:
-            # only want to reclassify if we're part two and have Js in our hand
-            self.hand_type = self._reclassify_hand()
-
-    def __repr__(self) -> str:
-        """Make sure we can pretty print the class."""
-        return f"{self.hand}: {HandType(self.hand_type).name}"
-
-    def __lt__(self, other: "Hand") -> bool:
-        """Enable comparison between Hands.
-
-        If the hand types are different, just return if we're less than the other.
-        Otherwise, go through the card order and compare each card.
-
-        Args:
-            other (Hand): the item being compared against
-        """
-        if self.hand_type == other.hand_type:
-            for idx in range(len(self.hand)):
-                if self.hand[idx] == other.hand[idx]:
-                    # move on to next card
-                    continue
-                return CARD_ORDER.index(self.hand[idx]) > CARD_ORDER.index(other.hand[idx])
-
-        return self.hand_type < other.hand_type
-
-    def _classify_hand(self) -> HandType:  # noqa: PLR0911
-        """Classify hand.
-
-        Based on the cards in the hand, return the matching HandType.
-
-        Returns:
-            HandType: the hand's HandType
-        """
-        for card in sorted(self.hand):
-            match self.hand.count(card):
-                case 5:
-                    return HandType.FIVE_OF_A_KIND
-                case 4:
-                    return HandType.FOUR_OF_A_KIND
-                case 3:
-                    # check the other card types
-                    other_cards = [_card for _card in self.hand if _card != card]
-                    if other_cards[0] == other_cards[1]:
-                        return HandType.FULL_HOUSE
-                    return HandType.THREE_OF_A_KIND
-                case 2:
-                    # check other card types
-                    other_cards = [_card for _card in self.hand if _card != card]
-                    if len(set(other_cards)) == 2:  # noqa: PLR2004
-                        # two other cards - meaning we have at least two pairs
-                        return HandType.TWO_PAIR
-                    if len(set(other_cards)) == 3:  # noqa: PLR2004
-                        # each of the other cards is different
-                        return HandType.ONE_PAIR
-                case 1:
-                    if len(set(self.hand)) == 5:  # noqa: PLR2004
-                        # 5 unique cards
-                        return HandType.HIGH_CARD
-        return HandType.HIGH_CARD
-
-    def _reclassify_hand(self) -> HandType:  # noqa: PLR0911
-        """Reclassify hand.
-
-        Used in part two only. If we contain jokers, then we can upgrade our hand.
-        Look at our current hand type and work out which hand type we can upgrade to.
-
-        Returns:
-            HandType: the re-calculated HandType (might be the same)
-        """
-        # we know that we're not FIVE of a KIND
-        # and that we have at least one J
-        match self.hand.count("J"):
-            # match base on number of jokers
-            case 1:
-                # only got one joker
-                match self.hand_type:
-                    case HandType.FOUR_OF_A_KIND:
-                        return HandType.FIVE_OF_A_KIND
-                    case HandType.THREE_OF_A_KIND:
-                        return HandType.FOUR_OF_A_KIND
-                    case HandType.TWO_PAIR:
-                        return HandType.FULL_HOUSE
-                    case HandType.ONE_PAIR:
-                        return HandType.THREE_OF_A_KIND
-                    case HandType.HIGH_CARD:
-                        return HandType.ONE_PAIR
-            case 2:
-                match self.hand_type:
-                    case HandType.THREE_OF_A_KIND | HandType.FULL_HOUSE:
-                        return HandType.FIVE_OF_A_KIND
-                    case HandType.TWO_PAIR:
-                        return HandType.FOUR_OF_A_KIND
-                    case HandType.ONE_PAIR:
-                        return HandType.THREE_OF_A_KIND
-            case 3:
-                match self.hand_type:
-                    case HandType.THREE_OF_A_KIND:
-                        return HandType.FOUR_OF_A_KIND
-                    case HandType.FULL_HOUSE:
-                        return HandType.FIVE_OF_A_KIND
-            case 4:
-                return HandType.FIVE_OF_A_KIND
-        return self.hand_type
-
-
-def _split_hands_and_bids(line: str, part_two: bool = False) -> Hand:
-    hand, bid = line.split(" ")
-    return Hand(hand, int(bid), part_two)
+# the sum of the squares of the number of each card identifies the hand type
+_HAND_TYPES_BY_SQUARES = np.full(HAND_SIZE**2 + 1, HandType.NONE, dtype=np.uint8)
+for _squares, _hand_type in (
+    (25, HandType.FIVE_OF_A_KIND),
+    (17, HandType.FOUR_OF_A_KIND),
+    (13, HandType.FULL_HOUSE),
+    (11, HandType.THREE_OF_A_KIND),
+    (9, HandType.TWO_PAIR),
+    (7, HandType.ONE_PAIR),
+    (5, HandType.HIGH_CARD),
+):
+    _HAND_TYPES_BY_SQUARES[_squares] = _hand_type
+
+
+@functools.cache
+def _classification_tables() -> np.ndarray:
+    """Builds the hand type of every possible hand under both sets of rules.
+
+    A hand's index is its cards' ranks in CARD_ORDER read as a base 13 number. Row 0 is the hand types
+    without jokers and row 1 with J as a joker, where the jokers always do best by joining the most common
+    other card.
+
+    Rather than counting every rank of every hand, each card is matched against the other four: the number
+    of cards matching a card is the count of its rank, and summing that over the hand's cards gives the sum
+    of the squares of the counts. Everything stays in small uint8 arrays of one row per card.
+
+    Returns:
+        np.ndarray: (2, 13 ** 5) uint8 array of HandTypes
+    """
+    indices = np.arange(BASE**HAND_SIZE, dtype=np.int32)
+    cards = np.stack([(indices // int(power) % BASE).astype(np.uint8) for power in _POWERS])
+    matches = (cards[:, np.newaxis] == cards[np.newaxis]).sum(axis=1, dtype=np.uint8)
+    squares = matches.sum(axis=0, dtype=np.uint8)
+
+    is_joker = cards == CARD_ORDER.index("J")
+    jokers = is_joker.sum(axis=0, dtype=np.uint8)
+    matches[is_joker] = 0
+    most_common = matches.max(axis=0)
+    # the most common card's count squared is always part of the sum, so this can't go negative
+    squares_with_jokers = matches.sum(axis=0, dtype=np.uint8) - most_common**2 + (most_common + jokers) ** 2
+    return _HAND_TYPES_BY_SQUARES[np.stack((squares, squares_with_jokers))]
+
+
+def _rank_sort_keys(sort_keys: np.ndarray, bids: np.ndarray) -> int:
+    """Ranks hands by their sort keys and gets the total winnings.
+
+    Args:
+        sort_keys (np.ndarray): each hand's sort key
+        bids (np.ndarray): each hand's bid
+
+    Returns:
+        int: the sum of each hand's bid multiplied by its rank
+    """
+    order = np.argsort(sort_keys, kind="stable")
+    ranks = np.arange(1, len(order) + 1, dtype=np.int64)
+    return int(bids[order] @ ranks)
+
+
+@profiling.track
+def _get_sort_keys(cards: np.ndarray, part_two: bool = False) -> np.ndarray:
+    """Gets the sort key of every hand at once.
+
+    The hand type is the most significant base 13 digit, followed by the rank of each card in order, so a
+    stronger hand always has a bigger key. All the hands are classified with a single read from the table.
+
+    Args:
+        cards (np.ndarray): (n, 5) array of each hand's cards as their rank in CARD_ORDER
+        part_two (bool, optional): whether J is a joker. Defaults to False.
+
+    Returns:
+        np.ndarray: each hand's sort key
+    """
+    hand_types = _classification_tables()[int(part_two), cards @ _POWERS]
+    ranks = _JOKER_RANKS[cards] if part_two else cards
+    return (HandType.HIGH_CARD - hand_types.astype(np.int64)) * BASE**HAND_SIZE + ranks @ _POWERS
+
+
+def parse(lines: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Parses the input into the hands and bids.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Raises:
+        ValueError: if a line isn't a hand and a bid
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (n, 5) array of each hand's cards as their rank in CARD_ORDER and the
+            bids
+    """
+    fields = " ".join(lines).split()
+    if len(fields) != 2 * len(lines):
+        msg = "Every line should be a hand and a bid."
+        raise ValueError(msg)
+    cards = np.frombuffer("".join(fields[::2]).translate(_CARD_BYTES).encode("latin-1"), dtype=np.uint8)
+    bids = np.array(fields[1::2], dtype=np.int64)
+    return cards.reshape(len(lines), HAND_SIZE).astype(np.int64), bids
+
+
+def part_one(data: tuple[np.ndarray, np.ndarray]) -> int:
+    """Gets the total winnings."""
+    cards, bids = data
+    return _rank_sort_keys(_get_sort_keys(cards), bids)
+
+
+def part_two(data: tuple[np.ndarray, np.ndarray]) -> int:
+    """Gets the total winnings with J as a joker."""
+    cards, bids = data
+    return _rank_sort_keys(_get_sort_keys(cards, True), bids)
 
 
 if __name__ == "__main__":
-    lines = inputs.get_input()
-
-    # part one
-    hands: list[Hand] = [_split_hands_and_bids(line) for line in lines]
-    hands = sorted(hands, reverse=True)
-    winnings = []
-    for idx in range(len(hands)):
-        hand = hands[idx]
-        rank = idx + 1
-        winning = rank * hand.bid
-        winnings.append(winning)
-    print(sum(winnings))
-
-    # part two
-    # re-organise card order to move J to the front
-    CARD_ORDER.replace("J", "")
-    CARD_ORDER = "J" + CARD_ORDER
-
-    hands: list[Hand] = [_split_hands_and_bids(line, True) for line in lines]
-    hands = sorted(hands, reverse=True)
-    winnings = []
-    for idx in range(len(hands)):
-        hand = hands[idx]
-        rank = idx + 1
-        winning = rank * hand.bid
-        winnings.append(winning)
-    print(sum(winnings))
+    data = parse(inputs.get_input(__file__))
+    print(part_one(data))
+    print(part_two(data))
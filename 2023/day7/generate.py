@@ -0,0 +1,21 @@
+"""Input generator for Advent of Code 2023 Day 7."""
+
+import random
+from collections.abc import Iterator
+
+BASE_HANDS = 1000
+CARDS = "23456789TJQKA"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    for _ in range(BASE_HANDS * scale):
+        yield f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}"
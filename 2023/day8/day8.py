@@ -1,8 +1,14 @@
 """Advent of Code 2023 Day 8."""
 
 import math
+from array import array
+from collections import defaultdict
 
-from advent_of_code.util import inputs
+import numpy as np
+from advent_of_code.util import cache, inputs
+
+# below this many nodes, NumPy's overhead per step outweighs walking the nodes one at a time
+VECTORISED_WALK_MIN = 32
 
 
 def _map_node(line: str) -> tuple[str, tuple[str, str]]:
@@ -15,8 +21,8 @@ def _map_node(line: str) -> tuple[str, tuple[str, str]]:
         tuple[str, tuple[str, str]]: the parent node, and the two child nodes
     """
     key, nodes = line.split(" = ")
-    nodes: tuple[str, str] = tuple(n.strip("(").strip(")") for n in nodes.split(", "))
-    return key, nodes
+    left, right = nodes[1:-1].split(", ")
+    return key, (left, right)
 
 
 def _map_nodes(lines: list[str]) -> dict[str, tuple[str, str]]:
@@ -35,44 +41,440 @@ def _map_nodes(lines: list[str]) -> dict[str, tuple[str, str]]:
     return node_map
 
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
-
-    directions: str = lines[0]
-    node_map = _map_nodes(lines[2:])
-
-    # part one
-    start = "AAA"
-    current_node = start
-    count = 0
-    while True:
-        for direction in directions:
-            count += 1
-            idx = 0 if direction == "L" else 1
-            current_node = node_map[current_node][idx]
-            if current_node == "ZZZ":
+class HitPattern:
+    """Every step on which a single walk is on a target.
+
+    A walk is periodic once it's back on a node it's been on before at the same point in the directions. Before
+    the threshold, the hits are listed explicitly in the tail; from the threshold on, a step is a hit if it's
+    congruent to one of the residues modulo the period.
+    """
+
+    def __init__(self, tail: list[int], threshold: int, period: int, residues: list[int]) -> None:
+        """Initialisation method.
+
+        Args:
+            tail (list[int]): the hits before the threshold
+            threshold (int): the first step of the periodic part
+            period (int): the period of the walk in steps
+            residues (list[int]): the hits from the threshold on, modulo the period
+        """
+        self.tail = tail
+        self.threshold = threshold
+        self.period = period
+        self.residues = residues
+        self._tail_set = set(tail)
+        self._residue_set = set(residues)
+
+    def __repr__(self) -> str:
+        """Nicer printing."""
+        return f"HitPattern({len(self.tail)} before {self.threshold}, {len(self.residues)} mod {self.period})"
+
+    def __contains__(self, step: int) -> bool:
+        """Whether the walk is on a target after the given number of steps."""
+        if step < self.threshold:
+            return step in self._tail_set
+        return step % self.period in self._residue_set
+
+
+def _prime_factors(number: int) -> list[int]:
+    """Gets the distinct prime factors of a number by trial division.
+
+    Args:
+        number (int): the number to factorise
+
+    Returns:
+        list[int]: the prime factors, smallest first
+    """
+    factors = []
+    factor = 2
+    while factor * factor <= number:
+        if number % factor == 0:
+            factors.append(factor)
+            while number % factor == 0:
+                number //= factor
+        factor += 1
+    if number > 1:
+        factors.append(number)
+    return factors
+
+
+def _reduce_period(residues: np.ndarray, period: int, factors: list[int]) -> tuple[list[int], int]:
+    """Reduces a set of residues to the smallest period it repeats with.
+
+    Walks often repeat far more often than the period their cycle is found with (e.g. a loop of 59 nodes reached
+    every 59 steps looks like it has a period of 59 times the length of the directions). Shrinking the period
+    keeps the residue sets small when they're combined.
+
+    Args:
+        residues (np.ndarray): the sorted, unique residues
+        period (int): the period
+        factors (list[int]): the prime factors of the period
+
+    Returns:
+        tuple[list[int], int]: the reduced residues and period
+    """
+    for factor in factors:
+        while period % factor == 0:
+            smaller = period // factor
+            # the residues repeat every `smaller` steps if shifting them by that much gives the same set
+            if not np.array_equal(np.sort((residues + smaller) % period), residues):
                 break
-        else:
-            continue
-        break
-    print(count)
-
-    # part two
-    starting_nodes = [node for node in node_map if node[-1] == "A"]
-    node_counts = {node: 0 for node in starting_nodes}
-    for start_node in starting_nodes:
+            residues, period = np.unique(residues % smaller), smaller
+    return residues.tolist(), period
+
+
+def _combine_residues(first: tuple[list[int], int], second: tuple[list[int], int]) -> tuple[list[int], int]:
+    """Combines two sets of residues with the generalised Chinese remainder theorem.
+
+    Args:
+        first (tuple[list[int], int]): the first residues and period
+        second (tuple[list[int], int]): the second residues and period
+
+    Returns:
+        tuple[list[int], int]: the residues, modulo the lcm of the periods, that are in both sets
+    """
+    (first_residues, first_period), (second_residues, second_period) = first, second
+    gcd = math.gcd(first_period, second_period)
+    reduced_second = second_period // gcd
+    lcm = first_period * reduced_second
+    inverse = pow(first_period // gcd, -1, reduced_second)
+
+    # residues can only be combined if they agree modulo the gcd
+    by_class = defaultdict(list)
+    for residue in second_residues:
+        by_class[residue % gcd].append(residue)
+
+    combined = []
+    for first_residue in first_residues:
+        for second_residue in by_class.get(first_residue % gcd, ()):
+            multiple = (second_residue - first_residue) // gcd * inverse % reduced_second
+            combined.append((first_residue + first_period * multiple) % lcm)
+    return sorted(combined), lcm
+
+
+def _earliest_common_hit(patterns: list[HitPattern]) -> int:
+    """Gets the first step on which every walk is on a target at once.
+
+    Args:
+        patterns (list[HitPattern]): the hit patterns of the walks
+
+    Raises:
+        ValueError: if the walks are never all on a target at once
+
+    Returns:
+        int: the step
+    """
+    # before the latest threshold, the step must be in that walk's tail
+    latest = max(patterns, key=lambda pattern: pattern.threshold)
+    for step in latest.tail:
+        if all(step in pattern for pattern in patterns):
+            return step
+
+    # after it, every walk is periodic; combining the smallest sets first keeps the intermediate sets small
+    residues, period = [0], 1
+    for pattern in sorted(patterns, key=lambda pattern: len(pattern.residues)):
+        residues, period = _combine_residues((residues, period), (pattern.residues, pattern.period))
+        if not residues:
+            msg = "The walks are never all on a target at once."
+            raise ValueError(msg)
+    return min(latest.threshold + (residue - latest.threshold) % period for residue in residues)
+
+
+class CycleGraph:
+    """The nodes a walk can be on at the start of a cycle of the directions, relabelled from 0.
+
+    Each node knows which node it ends the cycle on and every step of the cycle on which it's on a target. A walk
+    through the network is then a walk through this graph a whole cycle at a time.
+    """
+
+    def __init__(
+        self,
+        nodes: np.ndarray,
+        local: np.ndarray,
+        cycle_ends: np.ndarray,
+        hit_nodes: np.ndarray,
+        hit_steps: np.ndarray,
+        cycle_length: int,
+    ) -> None:
+        """Initialisation method.
+
+        Args:
+            nodes (np.ndarray): the network ids of the nodes
+            local (np.ndarray): maps network ids to the ids in this graph (-1 for nodes that aren't in it)
+            cycle_ends (np.ndarray): the node each node ends the cycle on
+            hit_nodes (np.ndarray): the node of each hit
+            hit_steps (np.ndarray): the step of the cycle of each hit, in step order for each node
+            cycle_length (int): the number of steps in a cycle
+        """
+        self.nodes = nodes
+        self.local = local
+        self.cycle_ends = cycle_ends
+        self.cycle_length = cycle_length
+        # group the hits by node; each node's hits are hit_steps[hit_starts[node]:hit_starts[node + 1]]
+        self.hit_steps = hit_steps[np.argsort(hit_nodes, kind="stable")]
+        self.hit_starts = np.concatenate(([0], np.cumsum(np.bincount(hit_nodes, minlength=len(nodes)))))
+
+    def __len__(self) -> int:
+        """The number of nodes."""
+        return len(self.nodes)
+
+    def __repr__(self) -> str:
+        """Nicer printing."""
+        return f"CycleGraph({len(self)} nodes, {len(self.hit_steps)} hits)"
+
+    def first_hits(self, starts: np.ndarray) -> np.ndarray:
+        """Gets the number of steps from each start until it first reaches a target.
+
+        Builds a binary lifting table of where each node ends up after 2^k whole cycles and whether it passes a
+        target on the way, then descends it for every start at once, so each start takes O(log n) jumps rather
+        than one step at a time.
+
+        Args:
+            starts (np.ndarray): the starts' ids in this graph
+
+        Raises:
+            ValueError: if a start never reaches a target
+
+        Returns:
+            np.ndarray: the number of steps for each start
+        """
+        passes = self.hit_starts[1:] > self.hit_starts[:-1]
+        # jumps[k][node] is where node is after 2^k cycles, hits[k][node] is whether a target is passed on the way
+        jumps, hits = [self.cycle_ends], [passes]
+        # the cycle boundaries must repeat within len(self) cycles, so that's as far as the table needs to go
+        for _ in range(len(self).bit_length()):
+            jumps.append(jumps[-1][jumps[-1]])
+            hits.append(hits[-1] | hits[-1][jumps[-2]])
+
+        current = np.array(starts, dtype=np.intp)
+        cycles = np.zeros(len(current), dtype=np.int64)
+        for level in reversed(range(len(jumps))):
+            move = ~hits[level][current]
+            current[move] = jumps[level][current[move]]
+            cycles[move] += 1 << level
+
+        if not passes[current].all():
+            msg = "Not every start reaches a target."
+            raise ValueError(msg)
+        return cycles * self.cycle_length + self.hit_steps[self.hit_starts[current]]
+
+    def hit_pattern(self, start: int) -> HitPattern:
+        """Works out every step on which the walk from the start is on a target.
+
+        Follows the walk a cycle at a time until it's back on a node it's started a cycle on before. From then on
+        it repeats, so its hits are the hits during the cycles before the repeat (the tail) and the hits during
+        the repeating cycles, modulo their total length.
+
+        Args:
+            start (int): the start's id in this graph
+
+        Returns:
+            HitPattern: the walk's hits
+        """
+        first_seen: dict[int, int] = {}
+        path = []
+        node = start
+        while node not in first_seen:
+            first_seen[node] = len(path)
+            path.append(node)
+            node = int(self.cycle_ends[node])
+        tail_cycles, loop_cycles = first_seen[node], len(path) - first_seen[node]
+
+        # gather every hit of every cycle on the path as a step from the start
+        path = np.array(path, dtype=np.intp)
+        counts = self.hit_starts[path + 1] - self.hit_starts[path]
+        total = int(counts.sum())
+        indices = np.repeat(self.hit_starts[path] - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        steps = np.repeat(np.arange(len(path), dtype=np.int64), counts) * self.cycle_length + self.hit_steps[indices]
+
+        threshold = tail_cycles * self.cycle_length + 1
+        period = loop_cycles * self.cycle_length
+        factors = sorted(set(_prime_factors(loop_cycles)) | set(_prime_factors(self.cycle_length)))
+        residues, period = _reduce_period(np.unique(steps[steps >= threshold] % period), period, factors)
+        return HitPattern(steps[steps < threshold].tolist(), threshold, period, residues)
+
+
+class Network:
+    """The node map compiled to integer ids.
+
+    Each node's left and right successors are stored as ids in two `array('i')` columns, so the network can be
+    walked for every node at once with NumPy views of them.
+    """
+
+    def __init__(self, directions: str, node_map: dict[str, tuple[str, str]]) -> None:
+        """Initialisation method.
+
+        Args:
+            directions (str): the L/R directions
+            node_map (dict[str, tuple[str, str]]): the node map
+        """
+        self.directions = directions
+        self.names = list(node_map)
+        self.ids = {name: idx for idx, name in enumerate(self.names)}
+        self.last_chars = np.array([name[-1] for name in self.names], dtype="U1")
+        self.left = array("i", [self.ids[left] for left, _ in node_map.values()])
+        self.right = array("i", [self.ids[right] for _, right in node_map.values()])
+        # intp copies of the columns, by direction, for indexing; this avoids NumPy converting the indices on every
+        # step of a walk
+        self.successors = {
+            "L": np.frombuffer(self.left, dtype=np.intc).astype(np.intp),
+            "R": np.frombuffer(self.right, dtype=np.intc).astype(np.intp),
+        }
+
+    def __len__(self) -> int:
+        """The number of nodes."""
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        """Nicer printing."""
+        return f"Network({len(self)} nodes, {len(self.directions)} directions)"
+
+    def ending_with(self, char: str) -> np.ndarray:
+        """Gets a mask of the nodes whose names end with the given character."""
+        return self.last_chars == char
+
+    def _walk_cycle_one_at_a_time(
+        self, nodes: np.ndarray, target_ids: set[int]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Walks the nodes through one full cycle of the directions, one node at a time.
+
+        Args:
+            nodes (np.ndarray): the ids of the nodes to walk
+            target_ids (set[int]): the ids of the nodes to look out for
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: the node each node ends the cycle on, and the index into
+                nodes and the step of each time a target is reached
+        """
+        cycle_ends, hit_nodes, hit_steps = [], [], []
+        for idx, node in enumerate(nodes.tolist()):
+            position = node
+            for step, direction in enumerate(self.directions, 1):
+                position = self.left[position] if direction == "L" else self.right[position]
+                if position in target_ids:
+                    hit_nodes.append(idx)
+                    hit_steps.append(step)
+            cycle_ends.append(position)
+        return (
+            np.array(cycle_ends, dtype=np.intp),
+            np.array(hit_nodes, dtype=np.intp),
+            np.array(hit_steps, dtype=np.int64),
+        )
+
+    def walk_cycle(self, nodes: np.ndarray, targets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Walks the nodes through one full cycle of the directions at once.
+
+        Args:
+            nodes (np.ndarray): the ids of the nodes to walk
+            targets (np.ndarray): mask of the nodes to look out for
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: the node each node ends the cycle on, and the index into
+                nodes and the step of each time a target is reached
+        """
+        successors = self.successors
+        positions = np.array(nodes, dtype=np.intp)
+        hit_nodes, hit_steps = [np.zeros(0, dtype=np.intp)], [np.zeros(0, dtype=np.int64)]
+        for step, direction in enumerate(self.directions, 1):
+            positions = successors[direction][positions]
+            hits = np.flatnonzero(targets[positions])
+            if len(hits):
+                hit_nodes.append(hits)
+                hit_steps.append(np.full(len(hits), step, dtype=np.int64))
+        return positions, np.concatenate(hit_nodes), np.concatenate(hit_steps)
+
+    def cycle_graph(self, starts: list[int], targets: np.ndarray) -> CycleGraph:
+        """Gets the nodes the starts can be on at the start of a cycle of the directions, and where they go.
+
+        Found by walking the starts through a cycle, then any new nodes they end on, and so on, so only the
+        nodes that can actually be at a cycle boundary are walked.
+
+        Args:
+            starts (list[int]): the ids of the start nodes
+            targets (np.ndarray): mask of the nodes to look out for
+
+        Returns:
+            CycleGraph: the graph of the nodes
+        """
+        target_ids = set(np.flatnonzero(targets).tolist())
+        seen = np.zeros(len(self), dtype=bool)
+        nodes, cycle_ends, hit_nodes, hit_steps = [], [], [], []
         count = 0
-        current_node = start_node
-        while True:
-            for direction in directions:
-                count += 1
-                idx = 0 if direction == "L" else 1
-                current_node = node_map[current_node][idx]
-
-                if current_node[-1] == "Z":
-                    break
+        frontier = np.unique(np.array(starts, dtype=np.intp))
+        while len(frontier):
+            seen[frontier] = True
+            if len(frontier) < VECTORISED_WALK_MIN:
+                frontier_ends, frontier_hits, frontier_steps = self._walk_cycle_one_at_a_time(frontier, target_ids)
             else:
-                continue
-            break
-        node_counts[start_node] = count
-    print(math.lcm(*node_counts.values()))
+                frontier_ends, frontier_hits, frontier_steps = self.walk_cycle(frontier, targets)
+            nodes.append(frontier)
+            cycle_ends.append(frontier_ends)
+            hit_nodes.append(frontier_hits + count)
+            hit_steps.append(frontier_steps)
+            count += len(frontier)
+            frontier = np.unique(frontier_ends[~seen[frontier_ends]])
+
+        all_nodes = np.concatenate(nodes)
+        local = np.full(len(self), -1, dtype=np.intp)
+        local[all_nodes] = np.arange(len(all_nodes))
+        return CycleGraph(
+            all_nodes,
+            local,
+            local[np.concatenate(cycle_ends)],
+            np.concatenate(hit_nodes),
+            np.concatenate(hit_steps),
+            len(self.directions),
+        )
+
+
+@cache.cached_parse
+def parse(lines: list[str]) -> Network:
+    """Parses the input into the compiled network.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        Network: the network
+    """
+    return Network(lines[0], _map_nodes(lines[2:]))
+
+
+def part_one(network: Network) -> int:
+    """Gets the number of steps from AAA to ZZZ.
+
+    Args:
+        network (Network): the network
+
+    Returns:
+        int: the number of steps
+    """
+    targets = np.zeros(len(network), dtype=bool)
+    targets[network.ids["ZZZ"]] = True
+    graph = network.cycle_graph([network.ids["AAA"]], targets)
+    (steps,) = graph.first_hits(graph.local[[network.ids["AAA"]]])
+    return int(steps)
+
+
+def part_two(network: Network) -> int:
+    """Gets the number of steps until every ghost is on a node ending in Z at once.
+
+    Each ghost's walk is split into a tail and a repeating part, and the steps on which all of them are on a Z
+    node are found with the Chinese remainder theorem. This doesn't rely on the ghosts' loops starting straight
+    away or each passing a single Z node.
+
+    Args:
+        network (Network): the network
+
+    Returns:
+        int: the number of steps
+    """
+    starts = np.flatnonzero(network.ending_with("A")).tolist()
+    graph = network.cycle_graph(starts, network.ending_with("Z"))
+    return _earliest_common_hit([graph.hit_pattern(int(graph.local[start])) for start in starts])
+
+
+if __name__ == "__main__":
+    network = parse(inputs.get_input(__file__))
+    print(part_one(network))
+    print(part_two(network))
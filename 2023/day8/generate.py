@@ -0,0 +1,117 @@
+"""Input generator for Advent of Code 2023 Day 8."""
+
+import random
+from collections.abc import Iterator
+from string import ascii_uppercase, digits
+
+BASE_GHOSTS = 6
+DIRECTIONS = 263
+CYCLE_LENGTHS = (41, 43, 47, 53, 59, 61, 67, 71, 73, 79)
+MAX_TAIL = 5
+MAX_HITS = 2
+NAME_CHARS = digits + ascii_uppercase
+INNER_CHARS = NAME_CHARS.replace("A", "").replace("Z", "")
+
+
+class _Namer:
+    """Hands out unique node names of a fixed width."""
+
+    def __init__(self, width: int) -> None:
+        """Initialisation method.
+
+        Args:
+            width (int): the width of the node names
+        """
+        self.width = width
+        self.count = 0
+        self.reserved = {"A" * (width - 1), "Z" * (width - 1)}
+
+    def _prefix(self) -> str:
+        """Gets the next unique prefix."""
+        while True:
+            value, self.count = self.count, self.count + 1
+            prefix = ""
+            for _ in range(self.width - 1):
+                value, idx = divmod(value, len(NAME_CHARS))
+                prefix = NAME_CHARS[idx] + prefix
+            if prefix not in self.reserved:
+                return prefix
+
+    def name(self, last: str) -> str:
+        """Gets the next unique node name ending in the given character."""
+        return self._prefix() + last
+
+
+def _rung(namer: _Namer, rng: random.Random) -> tuple[str, str]:
+    """Names a new pair of nodes."""
+    return namer.name(rng.choice(INNER_CHARS)), namer.name(rng.choice(INNER_CHARS))
+
+
+def _ghost(start: str, end: str, cycle: int, hits: list[int], namer: _Namer, rng: random.Random) -> Iterator[str]:
+    """Generates the node lines for a single ghost.
+
+    The ghost's path is a ladder of positions, each a pair of nodes: from either node of one position, L goes to
+    the left node of the next and R to the right one. The path is a tail of a few positions followed by a loop
+    of `cycle` positions. The positions the ghost is on at the given steps (modulo the cycle) are a single end
+    node instead of a pair, so whichever directions are taken the ghost is on an end node on exactly those
+    steps once it's past the tail.
+
+    Args:
+        start (str): the name of the start node
+        end (str): the name of the first end node
+        cycle (int): the length of the loop
+        hits (list[int]): the steps, modulo the cycle, to be on an end node
+        namer (_Namer): for naming the other nodes
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the node lines
+    """
+    tail = rng.randint(0, MAX_TAIL)
+    # the ghost is on loop position p at steps tail + 1 + p (modulo the cycle)
+    end_positions = sorted({(hit - tail - 1) % cycle for hit in hits})
+    ends = [end] + [namer.name("Z") for _ in end_positions[1:]]
+    loop = [_rung(namer, rng) for _ in range(cycle)]
+    for position, end_name in zip(end_positions, ends, strict=True):
+        loop[position] = (end_name, end_name)
+    path = [_rung(namer, rng) for _ in range(tail)] + loop
+
+    yield f"{start} = ({path[0][0]}, {path[0][1]})"
+    for position, next_position in zip(path, [*path[1:], loop[0]], strict=True):
+        for node in dict.fromkeys(position):
+            yield f"{node} = ({next_position[0]}, {next_position[1]})"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    The first ghost goes from AAA to ZZZ for part one. Every ghost with the same loop length is on an end node on
+    the same steps (modulo the loop length), so the ghosts are all on end nodes at once at some point, but the
+    tails and the positions of the end nodes mean that isn't simply the lcm of the loop lengths. Node names get
+    wider as the number of nodes grows.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    ghosts = BASE_GHOSTS * scale
+    nodes = ghosts * 2 * (max(CYCLE_LENGTHS) + MAX_TAIL)
+    width = 3
+    while len(NAME_CHARS) ** (width - 1) < nodes:
+        width += 1
+    namer = _Namer(width)
+    hits = {cycle: [rng.randrange(cycle) for _ in range(rng.randint(1, MAX_HITS))] for cycle in CYCLE_LENGTHS}
+
+    yield "".join(rng.choices("LR", k=DIRECTIONS))
+    yield ""
+
+    cycle = rng.choice(CYCLE_LENGTHS)
+    lines = list(_ghost("AAA", "ZZZ", cycle, hits[cycle], namer, rng))
+    for _ in range(ghosts - 1):
+        cycle = rng.choice(CYCLE_LENGTHS)
+        lines.extend(_ghost(namer.name("A"), namer.name("Z"), cycle, hits[cycle], namer, rng))
+    rng.shuffle(lines)
+    yield from lines
@@ -1,11 +1,39 @@
 """Advent of Code 2023 Day 9."""
 
-from itertools import pairwise
-from operator import add, sub
+import functools
+import math
+import warnings
+from collections import defaultdict
+from collections.abc import Iterable
 
-from advent_of_code.util import inputs
+import numpy as np
+from advent_of_code.util import inputs, profiling
 
+_INT64 = np.iinfo(np.int64)
 
+
+@functools.cache
+def _weights(length: int, backwards: bool = False) -> tuple[int, ...]:
+    """Gets the weights that extrapolate a sequence of the given length.
+
+    Repeatedly taking differences until they're all zero and adding back up is the same as fitting a polynomial
+    through the sequence, so the next item is a fixed combination of the items:
+    `sum((-1) ** (n - 1 - i) * comb(n, i) * seq[i])` and the previous item is `sum((-1) ** i * comb(n, i + 1) *
+    seq[i])`.
+
+    Args:
+        length (int): the length of the sequence
+        backwards (bool, optional): Whether to get the weights for the _previous_ item. Defaults to False.
+
+    Returns:
+        tuple[int, ...]: the weight of each item
+    """
+    if backwards:
+        return tuple((-1) ** idx * math.comb(length, idx + 1) for idx in range(length))
+    return tuple((-1) ** (length - 1 - idx) * math.comb(length, idx) for idx in range(length))
+
+
+@profiling.track
 def _get_next_sequence_item(seq: list[int], backwards: bool = False) -> int:
     """Gets the next item in the sequence.
 
@@ -17,24 +45,105 @@ def _get_next_sequence_item(seq: list[int], backwards: bool = False) -> int:
     Returns:
         int: the next time
     """
-    if set(seq) == {0}:
-        return 0
+    return sum(weight * item for weight, item in zip(_weights(len(seq), backwards), seq, strict=True))
 
-    idx = -1 if not backwards else 0
-    op = add if not backwards else sub
 
-    difference = [b - a for a, b in pairwise(seq)]
-    value = _get_next_sequence_item(difference, backwards)
-    return op(seq[idx], value)
+def _sum_next_sequence_items(sequences: np.ndarray, backwards: bool = False) -> int:
+    """Gets the sum of the next items of a batch of sequences of the same length.
 
+    Uses int64 when the result can't overflow, and exact Python ints otherwise.
 
-if __name__ == "__main__":
-    lines = inputs.get_input()
+    Args:
+        sequences (np.ndarray): (n, length) array of the sequences
+        backwards (bool, optional): Whether to find the _previous_ items. Defaults to False.
+
+    Returns:
+        int: the sum of the next items
+    """
+    weights = _weights(sequences.shape[1], backwards)
+    if sequences.dtype.kind == "i":
+        largest = int(np.abs(sequences).max(initial=0))
+        if largest * sum(map(abs, weights)) <= _INT64.max:
+            items = sequences @ np.array(weights, dtype=np.int64)
+            # the items fit, but their total might not
+            if int(np.abs(items).max(initial=0)) * len(items) <= _INT64.max:
+                return int(items.sum())
+            return sum(items.tolist())
+    return int((sequences.astype(object) @ np.array(weights, dtype=object)).sum())
+
+
+def _to_array(lines: list[str], length: int) -> np.ndarray:
+    """Reads lines of the same number of integers into an array.
+
+    Args:
+        lines (list[str]): the lines
+        length (int): the number of integers on each line
+
+    Raises:
+        ValueError: if the lines don't hold exactly `length` integers each
+
+    Returns:
+        np.ndarray: (len(lines), length) array, of int64 or of Python ints if the numbers might not fit in an
+            int64
+    """
+    text = " ".join(lines)
+    with warnings.catch_warnings():
+        # older NumPy only warns and stops at a token it can't read, which the size check below catches; newer
+        # NumPy raises a ValueError itself
+        warnings.simplefilter("ignore", DeprecationWarning)
+        sequences = np.fromstring(text, dtype=np.int64, sep=" ")
+    if sequences.size != len(lines) * length:
+        msg = f"Expected {len(lines) * length} integers in the sequences of length {length}, read {sequences.size}."
+        raise ValueError(msg)
+    # numbers that don't fit are clamped to the limits, so read them exactly instead
+    if (sequences == _INT64.max).any() or (sequences == _INT64.min).any():
+        sequences = np.array([int(number) for number in text.split()], dtype=object)
+    return sequences.reshape(len(lines), length)
 
-    part_one_totals = 0
-    part_two_totals = 0
+
+def parse(lines: list[str]) -> list[np.ndarray]:
+    """Parses the input into the sequences, grouped into arrays by length.
+
+    Args:
+        lines (list[str]): the input lines
+
+    Returns:
+        list[np.ndarray]: a (n, length) array of the sequences of each length
+    """
+    by_length = defaultdict(list)
+    for line in lines:
+        if line:
+            by_length[line.count(" ") + 1].append(line)
+    return [_to_array(same_length, length) for length, same_length in by_length.items()]
+
+
+def part_one(sequences: list[np.ndarray]) -> int:
+    """Gets the sum of the next item of each sequence."""
+    return sum(_sum_next_sequence_items(batch, False) for batch in sequences)
+
+
+def part_two(sequences: list[np.ndarray]) -> int:
+    """Gets the sum of the previous item of each sequence."""
+    return sum(_sum_next_sequence_items(batch, True) for batch in sequences)
+
+
+def stream(lines: Iterable[str]) -> tuple[int, int]:
+    """Solves both parts in a single pass over the lines.
+
+    Args:
+        lines (Iterable[str]): the input lines
+
+    Returns:
+        tuple[int, int]: the answers to part one and part two
+    """
+    part_one_totals, part_two_totals = 0, 0
     for line in lines:
         sequence = [int(ln) for ln in line.split()]
         part_one_totals += _get_next_sequence_item(sequence, False)
         part_two_totals += _get_next_sequence_item(sequence, True)
-    print(part_one_totals, part_two_totals)
+    return part_one_totals, part_two_totals
+
+
+if __name__ == "__main__":
+    sequences = parse(inputs.get_input(__file__))
+    print(part_one(sequences), part_two(sequences))
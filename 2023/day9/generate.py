@@ -0,0 +1,27 @@
+"""Input generator for Advent of Code 2023 Day 9."""
+
+import random
+from collections.abc import Iterator
+
+BASE_SEQUENCES = 200
+LENGTH = 21
+MAX_DEGREE = 6
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """Generates the lines of an input.
+
+    Each sequence is a random integer polynomial of up to degree six evaluated at 0 to 20.
+
+    Args:
+        scale (int): multiplier on the size of a real input
+        rng (random.Random): the seeded random generator to use
+
+    Yields:
+        Iterator[str]: the input lines
+    """
+    for _ in range(BASE_SEQUENCES * scale):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, MAX_DEGREE + 1))]
+        yield " ".join(
+            str(sum(coefficient * x**power for power, coefficient in enumerate(coefficients))) for x in range(LENGTH)
+        )
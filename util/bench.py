@@ -0,0 +1,282 @@
+"""Statistical benchmarks for solutions with stored baselines.
+
+Runs each day/part a number of times after some warmup runs, with the garbage collector disabled and timed with a
+monotonic clock. Reports the min, median and standard deviation. Results can be saved to a JSON baseline keyed by
+"year/day/part" and the input hash, and compared against later to flag regressions. Days without an input file for
+the chosen variant are reported and skipped.
+
+Usage:
+    python -m advent_of_code.util.bench run --repeat 20 --save
+    python -m advent_of_code.util.bench compare --year 2023 --day 7 --threshold 10
+"""
+
+import argparse
+import contextlib
+import gc
+import hashlib
+import io
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from advent_of_code.util import inputs, run
+
+BASELINE_PATH = run.ROOT.joinpath("bench_baseline.json")
+DEFAULT_REPEAT = 10
+DEFAULT_WARMUP = 2
+DEFAULT_THRESHOLD = 10.0
+
+
+@dataclass
+class BenchResult:
+    """The timings from benchmarking a single part."""
+
+    key: str
+    input_hash: str
+    times: list[float]
+
+    @property
+    def minimum(self) -> float:
+        """The fastest time."""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """The median time."""
+        return statistics.median(self.times)
+
+    @property
+    def stdev(self) -> float:
+        """The standard deviation of the times."""
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Converts the result to the baseline representation."""
+        return {"min": self.minimum, "median": self.median, "stdev": self.stdev, "repeat": len(self.times)}
+
+    def __str__(self) -> str:
+        """Nicer printing."""
+        return (
+            f"{self.key:<12} min {self.minimum * 1000:10.3f} ms  median {self.median * 1000:10.3f} ms  "
+            f"stdev {self.stdev * 1000:8.3f} ms  (n={len(self.times)})"
+        )
+
+
+@dataclass
+class Comparison:
+    """A benchmark result compared against the baseline."""
+
+    result: BenchResult
+    baseline_median: float | None
+    threshold: float
+
+    @property
+    def change(self) -> float | None:
+        """The percentage change in median time from the baseline."""
+        if self.baseline_median is None:
+            return None
+        return (self.result.median - self.baseline_median) / self.baseline_median * 100
+
+    @property
+    def regressed(self) -> bool:
+        """Whether the part got slower by more than the threshold."""
+        return self.change is not None and self.change > self.threshold
+
+    def __str__(self) -> str:
+        """Nicer printing."""
+        if self.change is None:
+            return f"{self.result.key:<12} no baseline for this input"
+        flag = "REGRESSED" if self.regressed else "ok"
+        return (
+            f"{self.result.key:<12} median {self.result.median * 1000:10.3f} ms  "
+            f"baseline {self.baseline_median * 1000:10.3f} ms  {self.change:+7.1f}%  {flag}"
+        )
+
+
+def input_hash(path: Path) -> str:
+    """Gets a hash of the input file's contents.
+
+    Args:
+        path (Path): the input file
+
+    Returns:
+        str: the hex digest
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def time_part(func: Callable[[Any], Any], arg: Any, repeat: int, warmup: int) -> list[float]:  # noqa: ANN401
+    """Times the given part (or parser) repeatedly.
+
+    The garbage collector is collected before and disabled during the timed runs so that collections
+    don't land randomly in the middle of them. Any output the part prints is discarded.
+
+    Args:
+        func (Callable[[Any], Any]): the part to time
+        arg (Any): the argument to pass to the part; the parsed input or, for the parser, the input lines
+        repeat (int): number of timed runs
+        warmup (int): number of untimed runs to do first
+
+    Returns:
+        list[float]: the time in seconds for each run
+    """
+    times = []
+    gc_enabled = gc.isenabled()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            func(arg)
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func(arg)
+                times.append(time.perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return times
+
+
+def bench_day(
+    day: run.Day,
+    parts: list[int] | None = None,
+    variant: str = "input",
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+) -> list[BenchResult]:
+    """Benchmarks parsing and the parts of the given day.
+
+    Parsing is benchmarked as part 'parse'; the parts are benchmarked on the input parsed once up front.
+
+    Args:
+        day (run.Day): the day to benchmark
+        parts (list[int] | None, optional): the parts to benchmark. Defaults to None (both parts).
+        variant (str, optional): the input variant to use. Defaults to "input".
+        repeat (int, optional): number of timed runs. Defaults to DEFAULT_REPEAT.
+        warmup (int, optional): number of untimed runs to do first. Defaults to DEFAULT_WARMUP.
+
+    Returns:
+        list[BenchResult]: the results for parsing and each part
+    """
+    path = run.get_day_input_path(day, variant)
+    lines = inputs.get_lines(path)
+    digest = input_hash(path)
+    parse = run.load_module(day).parse
+
+    results = [BenchResult(f"{day.year}/{day.day}/parse", digest, time_part(parse, lines, repeat, warmup))]
+    data = parse(lines)
+    results.extend(
+        BenchResult(f"{day.year}/{day.day}/{part}", digest, time_part(func, data, repeat, warmup))
+        for part, func in run.get_parts(day, parts).items()
+    )
+    return results
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict[str, dict[str, float | int]]]:
+    """Loads the baseline file.
+
+    Args:
+        path (Path, optional): the baseline file. Defaults to BASELINE_PATH.
+
+    Returns:
+        dict[str, dict[str, dict[str, float | int]]]: mapping of "year/day/part" to input hash to stats
+    """
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(results: list[BenchResult], path: Path = BASELINE_PATH) -> None:
+    """Saves the results to the baseline file.
+
+    Merges with any existing baseline; results for the same part and input are overwritten.
+
+    Args:
+        results (list[BenchResult]): the results to save
+        path (Path, optional): the baseline file. Defaults to BASELINE_PATH.
+    """
+    baseline = load_baseline(path)
+    for result in results:
+        baseline.setdefault(result.key, {})[result.input_hash] = result.to_dict()
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, dict[str, dict[str, float | int]]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compares the results against the baseline.
+
+    Only results that have a baseline for the same input hash are compared.
+
+    Args:
+        results (list[BenchResult]): the results to compare
+        baseline (dict[str, dict[str, dict[str, float | int]]]): the loaded baseline
+        threshold (float, optional): percentage slowdown in median to flag. Defaults to DEFAULT_THRESHOLD.
+
+    Returns:
+        list[Comparison]: the comparisons
+    """
+    comparisons = []
+    for result in results:
+        stats = baseline.get(result.key, {}).get(result.input_hash)
+        comparisons.append(Comparison(result, stats["median"] if stats else None, threshold))
+    return comparisons
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks solutions and compares them against a stored baseline.")
+    parser.add_argument("mode", choices=("run", "compare"), help="just benchmark or benchmark and compare")
+    parser.add_argument("-y", "--year", type=int, action="append", help="year to run (can be repeated)")
+    parser.add_argument("-d", "--day", type=int, action="append", help="day to run (can be repeated)")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=run.PARTS, help="part to run")
+    parser.add_argument("--variant", default="input", choices=inputs.INPUT_FILES, help="the input to use")
+    parser.add_argument(
+        "--example", dest="variant", action="store_const", const="example", help="same as --variant example"
+    )
+    parser.add_argument("-n", "--repeat", type=int, default=DEFAULT_REPEAT, help="number of timed runs")
+    parser.add_argument("-w", "--warmup", type=int, default=DEFAULT_WARMUP, help="number of warmup runs")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="save the results to the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="regression threshold in percent")
+
+    args = parser.parse_args()
+
+    selected = run.discover_days(args.year, args.day)
+    if not selected:
+        parser.error("No days found matching the given filters.")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+
+    all_results: list[BenchResult] = []
+    for selected_day in selected:
+        if not run.has_input(selected_day, args.variant):
+            print(f"{selected_day!s:<12} no {args.variant} input")
+            continue
+        for bench_result in bench_day(selected_day, args.part, args.variant, args.repeat, args.warmup):
+            print(bench_result)
+            all_results.append(bench_result)
+
+    regressions = []
+    if args.mode == "compare":
+        print()
+        for comparison in compare(all_results, load_baseline(args.baseline), args.threshold):
+            print(comparison)
+            if comparison.regressed:
+                regressions.append(comparison)
+
+    if args.save:
+        save_baseline(all_results, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+
+    if regressions:
+        sys.exit(1)
@@ -0,0 +1,198 @@
+"""On-disk cache for parsed inputs.
+
+Decorate a day's `parse` with `cached_parse` and, when the cache is enabled, its result is pickled to disk under a
+hash of the input's raw text, the source of the module the parser lives in and the source of the util modules it
+builds on. Repeated runs then skip the parse entirely, and changing the input, the parser's module or any util
+module invalidates the entry.
+
+The cache is opt-in; enable it with `enable()` or by setting the `AOC_PARSE_CACHE` environment variable to "1".
+The cache directory is capped in size and the least recently used entries are evicted first.
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+ROOT = Path(__file__).parent.parent
+CACHE_DIR = ROOT.joinpath(".parse_cache")
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+_CONFIG = {
+    "enabled": os.environ.get("AOC_PARSE_CACHE", "0") not in {"", "0"},
+    "max_bytes": MAX_CACHE_BYTES,
+}
+
+R = TypeVar("R")
+
+
+def enable(enabled: bool = True, max_bytes: int = MAX_CACHE_BYTES) -> None:
+    """Enables (or disables) the parse cache.
+
+    Args:
+        enabled (bool, optional): whether the cache should be used. Defaults to True.
+        max_bytes (int, optional): the maximum size of the cache directory. Defaults to MAX_CACHE_BYTES.
+    """
+    _CONFIG["enabled"] = enabled
+    _CONFIG["max_bytes"] = max_bytes
+
+
+def is_enabled() -> bool:
+    """Whether the parse cache is enabled."""
+    return _CONFIG["enabled"]
+
+
+def clear() -> None:
+    """Removes all entries from the cache."""
+    for path in CACHE_DIR.glob("*.pickle"):
+        path.unlink(missing_ok=True)
+
+
+@functools.cache
+def _util_hash() -> str:
+    """Gets a hash of the source of every module in `advent_of_code.util`.
+
+    Parsers build on the util modules, and may return their classes (like `grid.Grid`), so changing any of them
+    has to invalidate the cache too.
+
+    Returns:
+        str: the hex digest
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@functools.cache
+def _source_hash(func: Callable) -> str:
+    """Gets a hash of the source of the module the function lives in and of the util modules.
+
+    Hashing the whole module means changes to helpers called by the parser also invalidate the cache, and the
+    util modules are mixed in as parsers depend on them.
+
+    Args:
+        func (Callable): the parser
+
+    Returns:
+        str: the hex digest
+    """
+    try:
+        source = Path(inspect.getsourcefile(func)).read_bytes()
+    except (OSError, TypeError):
+        source = func.__code__.co_code
+    return hashlib.sha256(source + _util_hash().encode()).hexdigest()
+
+
+def _cache_key(func: Callable, lines: list[str]) -> str:
+    """Builds the cache key for a call of the parser.
+
+    The lines are hashed as the text they were read from rather than pickled, so building the key costs about the
+    same as reading the input.
+
+    Args:
+        func (Callable): the parser
+        lines (list[str]): the input lines
+
+    Returns:
+        str: the key
+    """
+    digest = hashlib.sha256(f"{func.__module__}.{func.__qualname__}:{_source_hash(func)}".encode())
+    digest.update("\n".join(lines).encode())
+    return digest.hexdigest()
+
+
+def _evict(max_bytes: int) -> None:
+    """Evicts the least recently used entries until the cache is under the size limit.
+
+    Entries have their modification time bumped whenever they're read, so the oldest mtime is the least recently used.
+
+    Args:
+        max_bytes (int): the maximum size of the cache directory
+    """
+    entries = []
+    for path in CACHE_DIR.glob("*.pickle"):
+        with contextlib.suppress(FileNotFoundError):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _load(path: Path) -> tuple[bool, object]:
+    """Loads an entry from the cache.
+
+    Args:
+        path (Path): the entry path
+
+    Returns:
+        tuple[bool, object]: whether there was a usable entry, and the entry
+    """
+    try:
+        with open(path, "rb") as file:
+            value = pickle.load(file)  # noqa: S301
+    except FileNotFoundError:
+        return False, None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError):
+        # corrupt or stale entry
+        path.unlink(missing_ok=True)
+        return False, None
+    os.utime(path)
+    return True, value
+
+
+def _store(path: Path, value: object) -> None:
+    """Stores an entry in the cache.
+
+    Writes to a temporary file first so that a partially written entry is never read.
+
+    Args:
+        path (Path): the entry path
+        value (object): the value to store
+    """
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(path)
+    _evict(_CONFIG["max_bytes"])
+
+
+def cached_parse(func: Callable[[list[str]], R]) -> Callable[[list[str]], R]:
+    """Decorator for caching the results of a day's `parse` on disk.
+
+    Does nothing other than call the parser unless the cache is enabled.
+
+    Args:
+        func (Callable[[list[str]], R]): the parser to cache; takes the input lines
+
+    Returns:
+        Callable[[list[str]], R]: the wrapped parser
+    """
+
+    @functools.wraps(func)
+    def wrapper(lines: list[str]) -> R:
+        if not _CONFIG["enabled"]:
+            return func(lines)
+
+        path = CACHE_DIR.joinpath(f"{_cache_key(func, lines)}.pickle")
+        found, value = _load(path)
+        if found:
+            return value
+
+        value = func(lines)
+        _store(path, value)
+        return value
+
+    return wrapper
@@ -12,8 +12,22 @@ MAX_DAY = 25
 PY_FILE_LINES = [
     "\n\nfrom advent_of_code.util import inputs",
     "\n\n\n",
+    "def parse(lines: list[str]) -> list[str]:\n",
+    '    """Parses the input lines into whatever the parts need."""\n',
+    "    return lines\n",
+    "\n\n",
+    "def part_one(data: list[str]) -> int:\n",
+    '    """Solves part one."""\n',
+    "    return 0\n",
+    "\n\n",
+    "def part_two(data: list[str]) -> int:\n",
+    '    """Solves part two."""\n',
+    "    return 0\n",
+    "\n\n",
     'if __name__ == "__main__":\n',
-    "    lines = inputs.get_example_input()\n",
+    "    data = parse(inputs.get_example_input(__file__))\n",
+    "    print(part_one(data))\n",
+    "    print(part_two(data))\n",
 ]
 
 
@@ -0,0 +1,71 @@
+"""Script for generating synthetic inputs of arbitrary size.
+
+Each day that supports it has a "YEAR/dayN/generate.py" module with a `generate(scale, rng)` function that
+yields the lines of a valid input roughly `scale` times the size of a real one. The same seed always produces
+the same input.
+
+By default the input is written to "generated_input.txt" in the day's directory, which the runner and
+benchmarks can use with `--variant generated`.
+
+Usage:
+    python -m advent_of_code.util.generate 2023 7 --scale 1000 --seed 1
+"""
+
+import argparse
+import importlib
+import random
+from pathlib import Path
+
+from advent_of_code.util import inputs
+
+PACKAGE = "advent_of_code"
+DEFAULT_SCALE = 10
+DEFAULT_SEED = 0
+
+
+def generate_input(year: int, day: int, path: Path, scale: int = DEFAULT_SCALE, seed: int = DEFAULT_SEED) -> int:
+    """Generates an input for the given day and writes it to the path.
+
+    The lines are written as they're generated rather than built up in memory first.
+
+    Args:
+        year (int): the year
+        day (int): the day
+        path (Path): the file to write to
+        scale (int, optional): multiplier on the size of a real input. Defaults to DEFAULT_SCALE.
+        seed (int, optional): the random seed. Defaults to DEFAULT_SEED.
+
+    Returns:
+        int: the number of lines written
+    """
+    module = importlib.import_module(f"{PACKAGE}.{year}.day{day}.generate")
+    rng = random.Random(seed)
+
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for line in module.generate(scale, rng):
+            file.write(line)
+            file.write("\n")
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generates a synthetic input for a day. Requires a year and a day.")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("-s", "--scale", type=int, default=DEFAULT_SCALE, help="multiplier on a real input's size")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed")
+    parser.add_argument("-o", "--output", type=Path, help="where to write the input; defaults to the day directory")
+
+    args = parser.parse_args()
+
+    if args.scale < 1:
+        parser.error("--scale must be at least 1.")
+
+    output = args.output or inputs.input_path(args.year, args.day, "generated")
+    try:
+        written = generate_input(args.year, args.day, output, args.scale, args.seed)
+    except ModuleNotFoundError:
+        parser.error(f"No generator for {args.year} day {args.day}.")
+    print(f"Wrote {written} lines to {output}")
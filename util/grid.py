@@ -0,0 +1,201 @@
+"""NumPy backed character grids.
+
+Loads a text grid into a 2-D `uint8` array in one go and provides vectorised masks, neighbour/dilation
+operations and labelling of connected runs along rows, so grid puzzles can work in array time rather than
+looping over every cell in Python.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+DIGITS = np.frombuffer(b"0123456789", dtype=np.uint8)
+EMPTY = "."
+
+
+class Grid:
+    """A rectangular grid of single byte characters."""
+
+    def __init__(self, array: np.ndarray) -> None:
+        """Initialisation method.
+
+        Args:
+            array (np.ndarray): 2-D uint8 array of the grid's characters
+        """
+        self.array = array
+
+    @classmethod
+    def from_lines(cls: type["Grid"], lines: list[str]) -> "Grid":
+        """Creates a grid from a list of lines.
+
+        Args:
+            lines (list[str]): the lines; must all be the same length and ASCII
+
+        Raises:
+            ValueError: if the lines aren't all the same length
+
+        Returns:
+            Grid: the grid
+        """
+        lines = [line for line in lines if line]
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            msg = "Grid lines must all be the same length."
+            raise ValueError(msg)
+        array = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        return cls(array.reshape(len(lines), width))
+
+    @classmethod
+    def from_file(cls: type["Grid"], path: str | Path) -> "Grid":
+        """Creates a grid straight from a file without splitting it into lines first.
+
+        Args:
+            path (str | Path): the file
+
+        Returns:
+            Grid: the grid
+        """
+        data = Path(path).read_bytes().replace(b"\r\n", b"\n").rstrip(b"\n")
+        width = data.find(b"\n")
+        if width == -1:
+            width = len(data)
+        array = np.frombuffer(data + b"\n", dtype=np.uint8).reshape(-1, width + 1)
+        # drop the newline column
+        return cls(array[:, :width])
+
+    def __getitem__(self, coords: tuple[int, int]) -> str:
+        """Gets the character at the given (row, column)."""
+        return chr(self.array[coords])
+
+    def __len__(self) -> int:
+        """The number of rows."""
+        return self.height
+
+    def __repr__(self) -> str:
+        """Nicer printing."""
+        return f"Grid({self.height}x{self.width})"
+
+    @property
+    def height(self) -> int:
+        """The number of rows."""
+        return self.array.shape[0]
+
+    @property
+    def width(self) -> int:
+        """The number of columns."""
+        return self.array.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The (height, width) of the grid."""
+        return self.array.shape
+
+    def char_mask(self, chars: str) -> np.ndarray:
+        """Gets a mask of the cells that are any of the given characters.
+
+        Args:
+            chars (str): the characters to match
+
+        Returns:
+            np.ndarray: boolean mask
+        """
+        if len(chars) == 1:
+            return self.array == ord(chars)
+        return np.isin(self.array, np.frombuffer(chars.encode("ascii"), dtype=np.uint8))
+
+    def digit_mask(self) -> np.ndarray:
+        """Gets a mask of the cells that are digits."""
+        return (self.array >= DIGITS[0]) & (self.array <= DIGITS[-1])
+
+    def symbol_mask(self, empty: str = EMPTY) -> np.ndarray:
+        """Gets a mask of the cells that are neither digits nor empty.
+
+        Args:
+            empty (str, optional): the character for empty cells. Defaults to EMPTY.
+
+        Returns:
+            np.ndarray: boolean mask
+        """
+        return ~self.digit_mask() & (self.array != ord(empty))
+
+    def digit_values(self) -> np.ndarray:
+        """Gets the digit value of every cell; only meaningful where `digit_mask` is True."""
+        return self.array.astype(np.int64) - DIGITS[0]
+
+    @staticmethod
+    def dilate(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+        """Grows the mask by one cell in every direction.
+
+        Args:
+            mask (np.ndarray): the boolean mask to grow
+            diagonal (bool, optional): whether to grow diagonally as well. Defaults to True.
+
+        Returns:
+            np.ndarray: mask of the cells that are True or next to a True cell
+        """
+        height, width = mask.shape
+        padded = np.zeros((height + 2, width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = mask
+        out = mask.copy()
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                if (d_row, d_col) == (0, 0) or (not diagonal and d_row and d_col):
+                    continue
+                out |= padded[1 + d_row : 1 + d_row + height, 1 + d_col : 1 + d_col + width]
+        return out
+
+    @staticmethod
+    def neighbours(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+        """Gets the cells next to a True cell that aren't True themselves.
+
+        Args:
+            mask (np.ndarray): the boolean mask
+            diagonal (bool, optional): whether diagonal cells count as next to. Defaults to True.
+
+        Returns:
+            np.ndarray: boolean mask of the neighbouring cells
+        """
+        return Grid.dilate(mask, diagonal) & ~mask
+
+    @staticmethod
+    def label_runs(mask: np.ndarray) -> tuple[np.ndarray, int]:
+        """Labels horizontally connected runs of True cells.
+
+        Runs never continue from the end of one row onto the start of the next. Labels are numbered from 1 in
+        row-major order of the start of each run; cells that aren't in a run are 0.
+
+        Args:
+            mask (np.ndarray): the boolean mask
+
+        Returns:
+            tuple[np.ndarray, int]: the labels and the number of runs
+        """
+        starts = mask.copy()
+        starts[:, 1:] &= ~mask[:, :-1]
+        labels = np.cumsum(starts.ravel(), dtype=np.int32).reshape(mask.shape)
+        labels[~mask] = 0
+        return labels, int(starts.sum())
+
+    def run_numbers(self, labels: np.ndarray) -> np.ndarray:
+        """Gets the number spelt out by each labelled run of digits.
+
+        Values must fit in an int64, so runs can be at most 18 digits long.
+
+        Args:
+            labels (np.ndarray): the labels from `label_runs` of a digit mask
+
+        Returns:
+            np.ndarray: the value of each run; index 0 is run 1
+        """
+        flat = labels.ravel()
+        positions = np.flatnonzero(flat)
+        if not positions.size:
+            return np.zeros(0, dtype=np.int64)
+        run_ids = flat[positions] - 1
+        # runs are contiguous in row-major order, so each run is a slice of positions
+        firsts = np.flatnonzero(np.diff(run_ids, prepend=-1))
+        lasts = np.append(firsts[1:], positions.size) - 1
+        powers = 10 ** (positions[lasts][run_ids] - positions)
+        # only the digits in runs are converted, rather than copying the whole grid to int64
+        digits = self.array.ravel()[positions].astype(np.int64) - DIGITS[0]
+        return np.add.reduceat(digits * powers, firsts)
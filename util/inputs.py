@@ -1,42 +1,98 @@
 """Input utility for Advent of Code stuff."""
 
-import inspect
-import os
+import functools
+from collections.abc import Iterator
 from pathlib import Path
 
+ROOT = Path(__file__).parent.parent
 
-def _get_lines(filename: str | Path) -> list[str]:
+INPUT_FILES = {
+    "input": "input.txt",
+    "example": "example_input.txt",
+    "example_pt2": "example_input_pt2.txt",
+    "generated": "generated_input.txt",
+}
+
+
+def get_lines(filename: str | Path) -> list[str]:
     """Gets the lines from a file."""
     with open(filename, encoding="utf-8") as file:
-        return [line.strip("\n") for line in file.readlines()]
+        return [line.strip("\n") for line in file]
+
+
+def iter_lines(filename: str | Path) -> Iterator[str]:
+    """Lazily yields the lines from a file.
+
+    Only one line is held in memory at a time, so this works on files larger than memory.
+    """
+    with open(filename, encoding="utf-8") as file:
+        for line in file:
+            yield line.strip("\n")
+
+
+def _variant_filename(variant: str) -> str:
+    """Gets the input filename for the given variant.
+
+    Args:
+        variant (str): the input variant; one of the keys of INPUT_FILES
+
+    Raises:
+        ValueError: if the variant isn't known
 
+    Returns:
+        str: the filename
+    """
+    try:
+        return INPUT_FILES[variant]
+    except KeyError:
+        msg = f"Unknown input variant: {variant}. Expected one of: {', '.join(INPUT_FILES)}."
+        raise ValueError(msg) from None
+
+
+@functools.cache
+def input_path(year: int, day: int, variant: str = "input") -> Path:
+    """Gets the full path to an input file for the given year and day.
+
+    Args:
+        year (int): the year
+        day (int): the day
+        variant (str, optional): the input variant. Defaults to "input".
 
-def _get_aoc_day_path(filename: str) -> Path:
-    """Gets the full AOC path of the file.
+    Returns:
+        Path: the absolute Path
+    """
+    return ROOT.joinpath(str(year), f"day{day}", _variant_filename(variant))
 
-    Assuming we're not calling the specific script from within the YEAR/DAY directory so the relative path to
-    the specified input file is likely wrong. Work out which file called this one and build an absolute path
-    to the input file. Return that Path.
+
+@functools.cache
+def input_path_from_file(module_file: str | Path, variant: str = "input") -> Path:
+    """Gets the full path to an input file that lives next to the given module.
 
     Args:
-        filename (str): the filename to make absolute
+        module_file (str | Path): the module's `__file__`
+        variant (str, optional): the input variant. Defaults to "input".
 
     Returns:
         Path: the absolute Path
     """
-    return Path(os.path.dirname(inspect.getmodule(inspect.stack()[2][0]).__file__), filename)
+    return Path(module_file).resolve().parent.joinpath(_variant_filename(variant))
+
+
+def get_example_input_part_two(module_file: str | Path) -> list[str]:
+    """Gets the lines from the 'example_input_pt2' file next to the given module."""
+    return get_lines(input_path_from_file(module_file, "example_pt2"))
 
 
-def get_example_input_part_two() -> list[str]:
-    """Gets the lines from the 'example_input' file."""
-    return _get_lines(_get_aoc_day_path("example_input_pt2.txt"))
+def get_example_input(module_file: str | Path) -> list[str]:
+    """Gets the lines from the 'example_input' file next to the given module."""
+    return get_lines(input_path_from_file(module_file, "example"))
 
 
-def get_example_input() -> list[str]:
-    """Gets the lines from the 'example_input' file."""
-    return _get_lines(_get_aoc_day_path("example_input.txt"))
+def get_input(module_file: str | Path) -> list[str]:
+    """Gets the lines from the 'input.txt' file next to the given module."""
+    return get_lines(input_path_from_file(module_file, "input"))
 
 
-def get_input() -> list[str]:
-    """Gets the lines from the 'input.txt' file."""
-    return _get_lines(_get_aoc_day_path("input.txt"))
+def iter_input(module_file: str | Path, variant: str = "input") -> Iterator[str]:
+    """Lazily yields the lines from the 'input.txt' (or another variant) file next to the given module."""
+    return iter_lines(input_path_from_file(module_file, variant))
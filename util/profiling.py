@@ -0,0 +1,233 @@
+"""Profiling utilities for finding hot spots in solutions.
+
+There are two parts to this:
+- `track` and `section` record call counts and cumulative time for marked hot functions and blocks of code.
+  They're only active when hooks are enabled *before* the solution modules are imported (with `enable()` or by
+  setting the `AOC_PROFILE` environment variable to "1"); otherwise `track` returns the function untouched so
+  there is no cost at all.
+- `StackSampler` and `cprofile_call` profile a whole call without any changes to the solution, and write
+  collapsed-stack (flame graph / speedscope) or pstats output respectively.
+"""
+
+import contextlib
+import cProfile
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+DEFAULT_INTERVAL = 0.001
+
+_CONFIG = {"enabled": os.environ.get("AOC_PROFILE", "0") not in {"", "0"}}
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class Stat:
+    """Call count and cumulative time for a tracked function or section."""
+
+    def __init__(self) -> None:
+        """Initialisation method."""
+        self.calls: int = 0
+        self.total: float = 0.0
+        self.depth: int = 0
+
+    def __repr__(self) -> str:
+        """Nicer printing."""
+        return f"calls={self.calls} total={self.total:.6f}s"
+
+
+STATS: dict[str, Stat] = {}
+
+
+def enable(enabled: bool = True) -> None:
+    """Enables (or disables) the profiling hooks.
+
+    Must be called before the modules using `track` are imported.
+
+    Args:
+        enabled (bool, optional): whether the hooks should record. Defaults to True.
+    """
+    _CONFIG["enabled"] = enabled
+
+
+def is_enabled() -> bool:
+    """Whether the profiling hooks are enabled."""
+    return _CONFIG["enabled"]
+
+
+def reset() -> None:
+    """Clears all recorded stats."""
+    STATS.clear()
+
+
+def _start(name: str) -> tuple[Stat, float]:
+    """Records the start of a call."""
+    stat = STATS.get(name)
+    if stat is None:
+        stat = STATS[name] = Stat()
+    stat.calls += 1
+    stat.depth += 1
+    return stat, time.perf_counter()
+
+
+def _stop(stat: Stat, start: float) -> None:
+    """Records the end of a call.
+
+    Only the outermost call of a recursive function adds to the cumulative time so that it isn't counted twice.
+    """
+    stat.depth -= 1
+    if not stat.depth:
+        stat.total += time.perf_counter() - start
+
+
+def track(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorator for recording the call count and cumulative time of a function.
+
+    Returns the function unchanged if the hooks aren't enabled when it's decorated.
+
+    Args:
+        func (Callable[P, R]): the function to track
+
+    Returns:
+        Callable[P, R]: the wrapped function
+    """
+    if not _CONFIG["enabled"]:
+        return func
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        stat, start = _start(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _stop(stat, start)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def _section(name: str) -> Iterator[None]:
+    """Records the call count and cumulative time of a block of code."""
+    stat, start = _start(name)
+    try:
+        yield
+    finally:
+        _stop(stat, start)
+
+
+def section(name: str) -> contextlib.AbstractContextManager:
+    """Context manager for recording the call count and cumulative time of a block of code.
+
+    Args:
+        name (str): the name to record the block under
+
+    Returns:
+        contextlib.AbstractContextManager: the context manager; does nothing if the hooks aren't enabled
+    """
+    if not _CONFIG["enabled"]:
+        return contextlib.nullcontext()
+    return _section(name)
+
+
+def report() -> list[str]:
+    """Formats the recorded stats, slowest first.
+
+    Returns:
+        list[str]: a line per tracked function or section
+    """
+    return [
+        f"{stat.total * 1000:10.3f} ms  {stat.calls:>10} calls  {name}"
+        for name, stat in sorted(STATS.items(), key=lambda item: item[1].total, reverse=True)
+    ]
+
+
+class StackSampler:
+    """Sampling profiler that records the call stacks of the thread that created it.
+
+    Use as a context manager around the code to profile. The stacks are recorded in the collapsed-stack format
+    used by flamegraph.pl, which speedscope can also open directly.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        """Initialisation method.
+
+        Args:
+            interval (float, optional): seconds between samples. Defaults to DEFAULT_INTERVAL.
+        """
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._switch_interval = sys.getswitchinterval()
+
+    def _sample(self) -> None:
+        """Records a sample of the profiled thread's stack."""
+        frame = sys._current_frames().get(self._thread_id)  # noqa: SLF001
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if stack:
+            self.samples[";".join(reversed(stack))] += 1
+
+    def _run(self) -> None:
+        """Samples until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "StackSampler":
+        """Starts sampling."""
+        # make the interpreter hand over the GIL often enough for the sampler to keep up
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stops sampling."""
+        self._stop_event.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def write_collapsed(self, path: Path) -> None:
+        """Writes the samples in the collapsed-stack format.
+
+        Args:
+            path (Path): the file to write to
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+
+def cprofile_call(path: Path, func: Callable[..., R], *args: Any) -> R:  # noqa: ANN401
+    """Calls the function under cProfile and writes the stats.
+
+    The stats can be loaded with `pstats` or viewed with tools like snakeviz.
+
+    Args:
+        path (Path): the file to write the stats to
+        func (Callable[..., R]): the function to profile
+        *args (Any): arguments to pass to the function
+
+    Returns:
+        R: the function's return value
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
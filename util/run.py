@@ -0,0 +1,412 @@
+"""Runner for discovering, running and timing solutions.
+
+Finds every "YEAR/dayN/dayN.py" module, imports it once, parses the input once and runs part one and part two
+separately on the parsed input. Prints the wall time, CPU time and peak memory for parsing and each part.
+
+Every day implements the `Solution` protocol: a `parse(lines)` function and `part_one(data)` and `part_two(data)`
+functions that take whatever `parse` returns. The parts mustn't modify the parsed data as it's shared.
+
+Days whose input can be processed a line at a time may also implement `stream(lines)`, which takes any iterable
+of lines and returns both answers from a single pass. With `--stream` the runner feeds these straight from the
+file, so they work on inputs larger than memory.
+
+Days without an input file for the chosen variant are reported and skipped rather than stopping the run.
+
+Peak memory is measured on a second, traced call, since tracing slows the timed call down. Anything the day's
+module memoises with `functools.cache` is cleared before that call so its first-call cost is counted, but the
+on-disk parse cache (`--cache`) isn't, so with it enabled the parse's peak is that of loading the cached result.
+
+Usage:
+    python -m advent_of_code.util.run
+    python -m advent_of_code.util.run --year 2023 --day 7 --part 1
+    python -m advent_of_code.util.run --year 2023 --day 5 --profile
+    python -m advent_of_code.util.run --stream --variant generated
+"""
+
+import argparse
+import functools
+import importlib
+import re
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from advent_of_code.util import cache, inputs, profiling
+
+ROOT = Path(__file__).parent.parent
+PACKAGE = "advent_of_code"
+PARTS = (1, 2)
+PART_FUNCTIONS = {1: "part_one", 2: "part_two"}
+PROFILE_DIR = ROOT.joinpath("profiles")
+PROFILE_MODES = ("sample", "cprofile")
+
+_DAY_PATH_RE = re.compile(r"^(\d{4})/day(\d+)/day\2\.py$")
+
+
+class Solution(Protocol):
+    """The functions every day's module implements."""
+
+    def parse(self, lines: list[str]) -> Any:  # noqa: ANN401
+        """Parses the input lines into whatever the parts need."""
+
+    def part_one(self, data: Any) -> Any:  # noqa: ANN401
+        """Solves part one from the parsed input."""
+
+    def part_two(self, data: Any) -> Any:  # noqa: ANN401
+        """Solves part two from the parsed input."""
+
+
+class StreamingSolution(Solution, Protocol):
+    """A solution that can also solve both parts in a single pass over the lines."""
+
+    def stream(self, lines: Iterable[str]) -> tuple[Any, Any]:
+        """Solves both parts from an iterable of lines."""
+
+
+@dataclass(frozen=True)
+class Day:
+    """Represents a single discovered day."""
+
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def module_name(self) -> str:
+        """The full module name for the day."""
+        return f"{PACKAGE}.{self.year}.day{self.day}.day{self.day}"
+
+    def __str__(self) -> str:
+        """Nicer printing."""
+        return f"{self.year} day {self.day}"
+
+
+@dataclass
+class PartResult:
+    """The result and measurements of running a single part."""
+
+    day: Day
+    part: int | str
+    answer: Any
+    wall: float
+    cpu: float
+    peak: int | None = None
+
+    def __str__(self) -> str:
+        """Nicer printing."""
+        peak = f"{self.peak / 1024 / 1024:8.2f} MiB" if self.peak is not None else "       - MiB"
+        return (
+            f"{self.day!s:<12} part {self.part!s:<4} "
+            f"wall {self.wall * 1000:10.3f} ms  cpu {self.cpu * 1000:10.3f} ms  peak {peak}  {self.answer}"
+        )
+
+
+def discover_days(years: list[int] | None = None, days: list[int] | None = None) -> list[Day]:
+    """Finds all the dayN.py modules.
+
+    Args:
+        years (list[int] | None, optional): only include these years. Defaults to None (all years).
+        days (list[int] | None, optional): only include these days. Defaults to None (all days).
+
+    Returns:
+        list[Day]: the discovered days, sorted by year and day
+    """
+    found: list[Day] = []
+    for path in ROOT.glob("*/day*/day*.py"):
+        match = _DAY_PATH_RE.match(path.relative_to(ROOT).as_posix())
+        if not match:
+            continue
+        year, day = int(match.group(1)), int(match.group(2))
+        if years and year not in years:
+            continue
+        if days and day not in days:
+            continue
+        found.append(Day(year, day, path))
+    return sorted(found, key=lambda found_day: (found_day.year, found_day.day))
+
+
+def load_module(day: Day) -> Solution:
+    """Imports the module for the given day.
+
+    Modules are only imported once; subsequent calls return the already imported module.
+
+    Args:
+        day (Day): the day to import
+
+    Returns:
+        Solution: the imported module
+    """
+    return importlib.import_module(day.module_name)
+
+
+def get_parts(day: Day, parts: list[int] | None = None) -> dict[int, Callable[[Any], Any]]:
+    """Gets the functions for each part of the given day.
+
+    Args:
+        day (Day): the day
+        parts (list[int] | None, optional): the parts to get. Defaults to None (both parts).
+
+    Returns:
+        dict[int, Callable[[Any], Any]]: mapping of part to the function that takes the parsed input
+    """
+    module = load_module(day)
+    return {part: getattr(module, PART_FUNCTIONS[part]) for part in parts or PARTS}
+
+
+def get_day_input_path(day: Day, variant: str = "input") -> Path:
+    """Gets the path to the input for the given day.
+
+    Args:
+        day (Day): the day
+        variant (str, optional): the input variant to use. Defaults to "input".
+
+    Returns:
+        Path: the input path
+    """
+    return inputs.input_path(day.year, day.day, variant)
+
+
+def has_input(day: Day, variant: str = "input") -> bool:
+    """Checks whether the given day has an input file for the variant.
+
+    Args:
+        day (Day): the day
+        variant (str, optional): the input variant to check. Defaults to "input".
+
+    Returns:
+        bool: whether the input file exists
+    """
+    return get_day_input_path(day, variant).is_file()
+
+
+def _clear_memoised(module: Solution) -> None:
+    """Clears the caches of any `functools.cache` decorated functions in the module."""
+    for value in vars(module).values():
+        cache_clear = getattr(value, "cache_clear", None)
+        if callable(cache_clear):
+            cache_clear()
+
+
+def _measure(
+    func: Callable[..., Any],
+    *args: Any,  # noqa: ANN401
+    memory: bool = True,
+    reset: Callable[[], None] | None = None,
+) -> tuple[Any, float, float, int | None]:
+    """Calls the function and measures it.
+
+    The timed call is made without tracing memory allocations as that slows things down considerably.
+    If memory is requested, the function is called a second time with tracemalloc enabled to get the peak.
+    Anything memoised by the first call would be missing from the second, so `reset` is called in between.
+
+    Args:
+        func (Callable[..., Any]): the function to call
+        *args (Any): arguments to pass to the function
+        memory (bool, optional): whether to measure peak memory. Defaults to True.
+        reset (Callable[[], None] | None, optional): clears any state memoised by the first call. Defaults to
+            None.
+
+    Returns:
+        tuple[Any, float, float, int | None]: the answer, the wall time, the CPU time and peak memory in bytes
+    """
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    answer = func(*args)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    peak = None
+    if memory:
+        if reset is not None:
+            reset()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return answer, wall, cpu, peak
+
+
+def run_day(day: Day, parts: list[int] | None = None, variant: str = "input", memory: bool = True) -> list[PartResult]:
+    """Runs and measures parsing and the parts for the given day.
+
+    Args:
+        day (Day): the day to run
+        parts (list[int] | None, optional): the parts to run. Defaults to None (both parts).
+        variant (str, optional): the input variant to use. Defaults to "input".
+        memory (bool, optional): whether to measure peak memory. Defaults to True.
+
+    Returns:
+        list[PartResult]: the results for parsing and each part run
+    """
+    lines = inputs.get_lines(get_day_input_path(day, variant))
+    module = load_module(day)
+    reset = functools.partial(_clear_memoised, module)
+
+    data, wall, cpu, peak = _measure(module.parse, lines, memory=memory, reset=reset)
+    results = [PartResult(day, "parse", None, wall, cpu, peak)]
+    for part, func in get_parts(day, parts).items():
+        answer, wall, cpu, peak = _measure(func, data, memory=memory, reset=reset)
+        results.append(PartResult(day, part, answer, wall, cpu, peak))
+    return results
+
+
+def stream_day(day: Day, variant: str = "input", memory: bool = True) -> PartResult | None:
+    """Runs and measures the single pass `stream` function for the given day.
+
+    The input is read lazily from the file rather than loaded up front, so the measurements include reading it.
+
+    Args:
+        day (Day): the day to run
+        variant (str, optional): the input variant to use. Defaults to "input".
+        memory (bool, optional): whether to measure peak memory. Defaults to True.
+
+    Returns:
+        PartResult | None: the result for both parts, or None if the day doesn't support streaming
+    """
+    module = load_module(day)
+    if not hasattr(module, "stream"):
+        return None
+
+    path = get_day_input_path(day, variant)
+    # `_measure` may call the function twice, so each call needs a fresh iterator
+    answer, wall, cpu, peak = _measure(
+        lambda: module.stream(inputs.iter_lines(path)), memory=memory, reset=functools.partial(_clear_memoised, module)
+    )
+    return PartResult(day, "stream", answer, wall, cpu, peak)
+
+
+def _profile(func: Callable[[Any], Any], arg: Any, stem: str, mode: str, out_dir: Path) -> tuple[Any, Path]:  # noqa: ANN401
+    """Calls the function under the profiler and writes the profile.
+
+    Args:
+        func (Callable[[Any], Any]): the function to profile
+        arg (Any): the argument to pass to the function
+        stem (str): the filename of the profile, without the extension
+        mode (str): either 'sample' or 'cprofile'
+        out_dir (Path): the directory to write the profile to
+
+    Returns:
+        tuple[Any, Path]: the function's return value and the written profile
+    """
+    if mode == "cprofile":
+        path = out_dir.joinpath(f"{stem}.prof")
+        return profiling.cprofile_call(path, func, arg), path
+
+    path = out_dir.joinpath(f"{stem}.folded")
+    with profiling.StackSampler() as sampler:
+        value = func(arg)
+    sampler.write_collapsed(path)
+    return value, path
+
+
+def profile_day(
+    day: Day,
+    parts: list[int] | None = None,
+    variant: str = "input",
+    mode: str = "sample",
+    out_dir: Path = PROFILE_DIR,
+) -> list[Path]:
+    """Profiles parsing and the parts for the given day.
+
+    In 'sample' mode, writes collapsed stacks ("YEAR-dayN-partP.folded") that can be opened in speedscope or
+    turned into a flame graph. In 'cprofile' mode, writes pstats files ("YEAR-dayN-partP.prof"). Parsing is
+    written as "YEAR-dayN-parse".
+
+    Args:
+        day (Day): the day to profile
+        parts (list[int] | None, optional): the parts to profile. Defaults to None (both parts).
+        variant (str, optional): the input variant to use. Defaults to "input".
+        mode (str, optional): either 'sample' or 'cprofile'. Defaults to "sample".
+        out_dir (Path, optional): the directory to write the profiles to. Defaults to PROFILE_DIR.
+
+    Returns:
+        list[Path]: the written profiles
+    """
+    lines = inputs.get_lines(get_day_input_path(day, variant))
+    stem = f"{day.year}-day{day.day}"
+
+    data, path = _profile(load_module(day).parse, lines, f"{stem}-parse", mode, out_dir)
+    written = [path]
+    for part, func in get_parts(day, parts).items():
+        _, path = _profile(func, data, f"{stem}-part{part}", mode, out_dir)
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs and times solutions. Runs everything if no filters are given.")
+    parser.add_argument("-y", "--year", type=int, action="append", help="year to run (can be repeated)")
+    parser.add_argument("-d", "--day", type=int, action="append", help="day to run (can be repeated)")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=PARTS, help="part to run (can be repeated)")
+    parser.add_argument("--variant", default="input", choices=inputs.INPUT_FILES, help="the input to use")
+    parser.add_argument(
+        "--example", dest="variant", action="store_const", const="example", help="same as --variant example"
+    )
+    parser.add_argument(
+        "--stream", action="store_true", help="solve both parts in one pass over the file, for days that support it"
+    )
+    parser.add_argument("--cache", action="store_true", help="cache parsed inputs on disk between runs")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="don't measure peak memory (halves the runtime); peak memory is measured on a second call with the "
+        "day's functools caches cleared, but not the on-disk parse cache",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=PROFILE_MODES,
+        help="profile instead of timing; writes collapsed stacks (sample) or pstats (cprofile)",
+    )
+    parser.add_argument("--profile-dir", type=Path, default=PROFILE_DIR, help="where to write the profiles")
+    parser.add_argument("--hooks", action="store_true", help="report call counts and times of tracked functions")
+
+    args = parser.parse_args()
+
+    # answers for large generated inputs can have more digits than Python will print by default
+    sys.set_int_max_str_digits(0)
+    if args.cache:
+        cache.enable()
+    if args.hooks:
+        # has to happen before the days are imported
+        profiling.enable()
+
+    selected = discover_days(args.year, args.day)
+    if not selected:
+        parser.error("No days found matching the given filters.")
+
+    if args.profile:
+        for selected_day in selected:
+            if not has_input(selected_day, args.variant):
+                print(f"{selected_day!s:<12} no {args.variant} input")
+                continue
+            for profile_path in profile_day(selected_day, args.part, args.variant, args.profile, args.profile_dir):
+                print(f"{selected_day!s:<12} wrote {profile_path}")
+    else:
+        total_wall, total_cpu = 0.0, 0.0
+        for selected_day in selected:
+            if not has_input(selected_day, args.variant):
+                print(f"{selected_day!s:<12} no {args.variant} input")
+                continue
+            if args.stream:
+                stream_result = stream_day(selected_day, args.variant, not args.no_memory)
+                if stream_result is None:
+                    print(f"{selected_day!s:<12} doesn't support streaming")
+                    continue
+                print(stream_result)
+                total_wall += stream_result.wall
+                total_cpu += stream_result.cpu
+                continue
+            for result in run_day(selected_day, args.part, args.variant, not args.no_memory):
+                print(result)
+                total_wall += result.wall
+                total_cpu += result.cpu
+        print(f"Total: wall {total_wall * 1000:.3f} ms  cpu {total_cpu * 1000:.3f} ms")
+
+    if args.hooks:
+        print("\n".join(profiling.report()))
@@ -0,0 +1,52 @@
+"""Streaming reducers over input lines.
+
+Folds inputs made of blank line separated groups one group at a time and keeps only the best few results, so
+puzzles like these use O(k) memory however large the input is and work directly on `inputs.iter_lines`.
+"""
+
+import heapq
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def fold_groups(lines: Iterable[str], fold: Callable[[T, str], T], initial: T) -> Iterator[T]:
+    """Lazily folds each blank line separated group of lines into a single value.
+
+    The final group is yielded whether or not the input ends with a blank line. Runs of blank lines don't
+    make empty groups.
+
+    Args:
+        lines (Iterable[str]): the lines, without their newlines
+        fold (Callable[[T, str], T]): combines a group's value so far with its next line
+        initial (T): the value of a group before any of its lines
+
+    Yields:
+        Iterator[T]: the folded value of each group, in order
+    """
+    value, in_group = initial, False
+    for line in lines:
+        if line:
+            value, in_group = fold(value, line), True
+        elif in_group:
+            yield value
+            value, in_group = initial, False
+    if in_group:
+        yield value
+
+
+def top_k(values: Iterable[T], k: int) -> list[T]:
+    """Gets the k largest values in a single pass.
+
+    Only a min-heap of the k largest values seen so far is kept, so this takes O(n log k) time and O(k)
+    memory.
+
+    Args:
+        values (Iterable[T]): the values
+        k (int): how many to keep
+
+    Returns:
+        list[T]: the k largest values, largest first; fewer if there aren't k values
+    """
+    return heapq.nlargest(k, values)